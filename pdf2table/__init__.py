@@ -6,7 +6,7 @@ from pdf2table.frameworks.logging_config import setup_logging, get_logger
 setup_logging(
     log_level=os.getenv("PDF2TABLE_LOG_LEVEL", "INFO"),
     console_output=True,
-    file_output=True,
+    file_output=os.getenv("PDF2TABLE_FILE_OUTPUT", "false").lower() == "true",
     format_type="detailed",
     use_colors=os.getenv("PDF2TABLE_USE_COLORS", "true").lower() == "true",
 )
@@ -1,8 +1,15 @@
+from functools import cached_property, lru_cache
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 import numpy as np
 
 
+# Instance slots of a pydantic v2 model, which BoundingBox._trusted fills in
+_HAS_V2_SLOTS = set(getattr(BaseModel, '__slots__', ())) == {
+    '__dict__', '__pydantic_fields_set__', '__pydantic_extra__',
+    '__pydantic_private__',
+}
+
 class BoundingBox(BaseModel):
     """Value object representing a bounding box."""
     x_min: int
@@ -12,23 +19,52 @@ class BoundingBox(BaseModel):
 
     # Remove custom __init__ - Pydantic handles this automatically
 
-    @validator('x_min', 'y_min', 'x_max', 'y_max')
+    @field_validator('x_min', 'y_min', 'x_max', 'y_max')
+    @classmethod
     def check_non_negative(cls, value):
         if value < 0:
             raise ValueError("Bounding box coordinates must be non-negative")
         return value
 
-    @validator('x_max')
-    def x_max_greater_than_x_min(cls, value, values):
-        if 'x_min' in values and values['x_min'] >= value:
+    @field_validator('x_max')
+    @classmethod
+    def x_max_greater_than_x_min(cls, value, info: ValidationInfo):
+        if 'x_min' in info.data and info.data['x_min'] >= value:
             raise ValueError("x_max must be greater than x_min")
         return value
 
-    @validator('y_max')
-    def y_max_greater_than_y_min(cls, value, values):
-        if 'y_min' in values and values['y_min'] >= value:
+    @field_validator('y_max')
+    @classmethod
+    def y_max_greater_than_y_min(cls, value, info: ValidationInfo):
+        if 'y_min' in info.data and info.data['y_min'] >= value:
             raise ValueError("y_max must be greater than y_min")
         return value
+
+    @classmethod
+    def _trusted(cls, x_min: int, y_min: int, x_max: int, y_max: int) -> 'BoundingBox':
+        """Build a box without validation, for coordinates already known to be
+        valid (non-negative, non-empty), e.g. model outputs clipped in bulk.
+
+        Does what ``model_construct`` does for these four fields; the generic
+        ``model_construct`` is slower than validating in pydantic v2. The fast
+        path writes pydantic's instance slots directly, so it falls back to
+        ``model_construct`` if a pydantic release lays them out differently.
+        """
+        if not _HAS_V2_SLOTS:
+            return cls.model_construct(
+                x_min=x_min, y_min=y_min, x_max=x_max, y_max=y_max
+            )
+        box = object.__new__(cls)
+        object.__setattr__(
+            box, '__dict__',
+            {'x_min': x_min, 'y_min': y_min, 'x_max': x_max, 'y_max': y_max},
+        )
+        object.__setattr__(
+            box, '__pydantic_fields_set__', {'x_min', 'y_min', 'x_max', 'y_max'}
+        )
+        object.__setattr__(box, '__pydantic_extra__', None)
+        object.__setattr__(box, '__pydantic_private__', None)
+        return box
     
     @property
     def width(self) -> int:
@@ -59,6 +95,17 @@ class BoundingBox(BaseModel):
                    self.y_max <= other.y_min or other.y_max <= self.y_min)
 
 
+@lru_cache(maxsize=64)
+def is_structural_cell_type(cell_type: str) -> bool:
+    """Whether a cell label describes table structure (a row or a column).
+
+    Labels come from a small fixed vocabulary, so the string checks run once
+    per distinct label.
+    """
+    cell_type = cell_type.lower()
+    return "row" in cell_type or "column" in cell_type
+
+
 class DetectedCell(BaseModel):
     """Entity representing a detected table cell."""
     box: BoundingBox
@@ -68,10 +115,10 @@ class DetectedCell(BaseModel):
 
     # Remove custom __init__ - Pydantic handles this automatically
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @validator('cell_type')
+    @field_validator('cell_type')
+    @classmethod
     def cell_type_not_empty(cls, value):
         if not value.strip():
             raise ValueError("Cell type cannot be empty")
@@ -81,6 +128,10 @@ class DetectedCell(BaseModel):
     def is_high_confidence(self) -> bool:
         return self.confidence_score >= 0.6
 
+    @property
+    def is_structural(self) -> bool:
+        return is_structural_cell_type(self.cell_type)
+
 
 class GridCell(BaseModel):
     """Entity representing a cell in a table grid."""
@@ -111,23 +162,30 @@ class TableGrid(BaseModel):
     
     # Remove custom __init__ - Pydantic handles this automatically
     
-    @validator('cells')
-    def check_basic_cell_validity(cls, cells, values):
+    @field_validator('cells')
+    @classmethod
+    def check_basic_cell_validity(cls, cells, info: ValidationInfo):
         """Basic validation - just ensure cells have valid positions."""
-        if 'n_rows' in values and 'n_cols' in values:
-            n_rows = values['n_rows']
-            n_cols = values['n_cols']
+        if 'n_rows' in info.data and 'n_cols' in info.data:
+            n_rows = info.data['n_rows']
+            n_cols = info.data['n_cols']
             for cell in cells:
                 if not (0 <= cell.row < n_rows and 0 <= cell.col < n_cols):
                     raise ValueError(f"Cell position ({cell.row}, {cell.col}) exceeds grid dimensions ({n_rows}x{n_cols})")
         return cells
     
+    @cached_property
+    def _cells_by_position(self) -> Dict[tuple, GridCell]:
+        """(row, col) -> cell index, built on first use; the first cell at a
+        position wins. Grids are not modified after construction."""
+        index: Dict[tuple, GridCell] = {}
+        for cell in self.cells:
+            index.setdefault((cell.row, cell.col), cell)
+        return index
+
     def get_cell(self, row: int, col: int) -> Optional[GridCell]:
         """Get cell at specific position."""
-        for cell in self.cells:
-            if cell.row == row and cell.col == col:
-                return cell
-        return None
+        return self._cells_by_position.get((row, col))
     
     def get_headers(self) -> List[str]:
         """Extract header row text."""
@@ -141,14 +199,15 @@ class TableGrid(BaseModel):
     def to_row_format(self) -> List[Dict[str, str]]:
         """Convert grid to list of row dictionaries."""
         headers = self.get_headers()
+
+        cells_by_position = self._cells_by_position
+
         rows_data = []
-        
-        for r_idx in range(1, self.n_rows):
+        for row in range(1, self.n_rows):
             row_dict = {}
-            for c_idx in range(self.n_cols):
-                header = headers[c_idx] if c_idx < len(headers) else f"Column{c_idx + 1}"
-                cell = self.get_cell(r_idx, c_idx)
-                row_dict[header] = cell.text.strip() if cell else ""
+            for col, header in enumerate(headers):
+                cell = cells_by_position.get((row, col))
+                row_dict[header] = cell.text.strip() if cell is not None else ""
             rows_data.append(row_dict)
         
         return rows_data
@@ -162,7 +221,8 @@ class DetectedTable(BaseModel):
     source_file: str
     grid: Optional[TableGrid] = None
 
-    @validator('source_file')
+    @field_validator('source_file')
+    @classmethod
     def source_file_not_empty(cls, value):
         if not value.strip():
             raise ValueError("Source file cannot be empty")
@@ -191,16 +251,17 @@ class PageImage(BaseModel):
     source_file: str
     words: List
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    @validator('image_data')
+    @field_validator('image_data')
+    @classmethod
     def image_data_not_empty(cls, value):
         if not isinstance(value, np.ndarray) or value.size == 0:
             raise ValueError("Image data must be a non-empty numpy array")
         return value
 
-    @validator('source_file')
+    @field_validator('source_file')
+    @classmethod
     def source_file_not_empty(cls, value):
         if not value.strip():
             raise ValueError("Source file cannot be empty")
@@ -217,3 +278,16 @@ class PageImage(BaseModel):
     @property
     def dimensions(self) -> tuple:
         return (self.height, self.width)
+
+    @cached_property
+    def word_boxes(self) -> np.ndarray:
+        """(W, 4) float64 array of the ``words`` boxes (x0, y0, x1, y1), built
+        on first use. ``words`` is not modified after construction."""
+        if not self.words:
+            return np.empty((0, 4), dtype=np.float64)
+        return np.array([word[:4] for word in self.words], dtype=np.float64)
+
+    @cached_property
+    def word_texts(self) -> np.ndarray:
+        """(W,) object array of the ``words`` strings, built on first use."""
+        return np.array([word[4] for word in self.words], dtype=object)
@@ -0,0 +1,100 @@
+"""
+Tensor preprocessing of page and table images for the Table Transformer.
+
+Does what ``DetrFeatureExtractor`` does for these models (aspect-preserving
+resize, rescale, normalize, pad and pixel mask) with torch operations on
+whole images, instead of the feature extractor's per-image PIL/NumPy round
+trips. The feature extractor is still used for its configuration and for
+post-processing.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from transformers import DetrFeatureExtractor
+from transformers.models.detr.image_processing_detr import get_size_with_aspect_ratio
+
+
+class TensorImagePreprocessor:
+    """Turn RGB ``uint8`` images into Table Transformer inputs.
+
+    The images are converted on ``device``, so on CUDA only the ``uint8``
+    pixels cross the bus and the resize runs on the GPU.
+    """
+
+    def __init__(
+        self,
+        feature_extractor: DetrFeatureExtractor,
+        size: Optional[dict] = None,
+        device: str = "cpu",
+    ):
+        """
+        Args:
+            feature_extractor: Feature extractor of the model, whose resize and
+                normalization settings are reproduced
+            size: Resize settings overriding the feature extractor's
+                (``shortest_edge``/``longest_edge``)
+            device: Device the images are converted on
+        """
+        size = size or feature_extractor.size
+        self.shortest_edge = size["shortest_edge"]
+        self.longest_edge = size.get("longest_edge")
+        self.device = device
+        # The antialiased bilinear kernel takes uint8 only on CPU; other
+        # devices resize after the float conversion
+        self._resize_uint8 = torch.device(device).type == "cpu"
+        # Rescaling and normalization folded into one multiply-add per pixel
+        std = torch.tensor(feature_extractor.image_std, dtype=torch.float32)
+        mean = torch.tensor(feature_extractor.image_mean, dtype=torch.float32)
+        self._scale = (feature_extractor.rescale_factor / std).view(3, 1, 1).to(device)
+        self._offset = (-mean / std).view(3, 1, 1).to(device)
+
+    def __call__(self, images: List[np.ndarray]) -> Dict[str, torch.Tensor]:
+        """Preprocess HxWx3 ``uint8`` images into a padded batch.
+
+        Returns:
+            dict with ``pixel_values`` (float32, N x 3 x H x W) and
+            ``pixel_mask`` (int64, N x H x W, 1 on image pixels), laid out as
+            the feature extractor's ``return_tensors="pt"`` output
+        """
+        resized = [self._resize(image) for image in images]
+
+        # Pad at the bottom and right to the largest image of the batch
+        height = max(image.shape[1] for image in resized)
+        width = max(image.shape[2] for image in resized)
+        pixel_values = torch.zeros(
+            len(resized), 3, height, width, dtype=torch.float32, device=self.device
+        )
+        pixel_mask = torch.zeros(
+            len(resized), height, width, dtype=torch.int64, device=self.device
+        )
+        for i, image in enumerate(resized):
+            h, w = image.shape[1:]
+            pixel_values[i, :, :h, :w] = image
+            pixel_mask[i, :h, :w] = 1
+
+        return {"pixel_values": pixel_values, "pixel_mask": pixel_mask}
+
+    def _resize(self, image: np.ndarray) -> torch.Tensor:
+        """Resize and normalize one image into a 3 x h x w float tensor."""
+        # Strided crops (table and cell slices) are copied into a contiguous
+        # buffer first, and .to() copies again to a non-CPU device; a
+        # contiguous page on CPU is wrapped without a copy. The HWC pixels
+        # are then viewed as a channels-last 1 x 3 x H x W batch
+        tensor = torch.from_numpy(np.ascontiguousarray(image)).to(self.device)
+        tensor = tensor.permute(2, 0, 1).unsqueeze(0)
+        if not self._resize_uint8:
+            tensor = tensor.float()
+        size = get_size_with_aspect_ratio(
+            image.shape[:2], self.shortest_edge, self.longest_edge
+        )
+        if size != tuple(image.shape[:2]):
+            # Antialiased bilinear matches the feature extractor's PIL
+            # resample. On CPU, resizing before the float conversion keeps
+            # the large input in uint8, which has a vectorized kernel
+            tensor = F.interpolate(
+                tensor, size=size, mode="bilinear", antialias=True, align_corners=False
+            )
+        return torch.addcmul(self._offset, tensor[0].float(), self._scale)
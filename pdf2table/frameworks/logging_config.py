@@ -84,8 +84,6 @@ class LoggerFactory:
             cls._log_dir = project_root / "logs"
         else:
             cls._log_dir = Path(log_dir)
-            
-        cls._log_dir.mkdir(exist_ok=True)
         
         formats = {
             "simple": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -135,6 +133,7 @@ class LoggerFactory:
             config["loggers"]["root"]["handlers"].append("console")
         
         if file_output:
+            cls._log_dir.mkdir(exist_ok=True)
             config["handlers"]["file"] = {
                 "class": "logging.handlers.RotatingFileHandler",
                 "level": log_level,
@@ -160,7 +159,9 @@ class LoggerFactory:
         cls._initialized = True
         
         logger = logging.getLogger("pdf2table.logging_config")
-        logger.info(f"Logging initialized - Level: {log_level}, Log dir: {cls._log_dir}")
+        logger.info(
+            "Logging initialized - Level: %s, Log dir: %s", log_level, cls._log_dir
+        )
     
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
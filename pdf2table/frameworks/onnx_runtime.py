@@ -0,0 +1,150 @@
+"""
+ONNX Runtime execution of Table Transformer models.
+
+onnxruntime is optional: it is only imported when an ONNX model path is
+configured on the detector or the structure recognizer.
+"""
+
+import os
+from types import SimpleNamespace
+from typing import List, Optional
+
+import torch
+
+from pdf2table.frameworks.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# Tried in order; providers missing from the installed onnxruntime build are
+# skipped
+DEFAULT_PROVIDERS = [
+    "TensorrtExecutionProvider",
+    "OpenVINOExecutionProvider",
+    "CUDAExecutionProvider",
+    "CPUExecutionProvider",
+]
+
+
+class _DetrOutputsWrapper(torch.nn.Module):
+    """Expose a HF DETR model as a plain (logits, pred_boxes) graph."""
+
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.model = model
+
+    def forward(self, pixel_values: torch.Tensor, pixel_mask: torch.Tensor):
+        outputs = self.model(pixel_values=pixel_values, pixel_mask=pixel_mask)
+        return outputs.logits, outputs.pred_boxes
+
+
+class OnnxTableTransformer:
+    """Run an exported Table Transformer with onnxruntime.
+
+    Calling the instance mirrors calling the PyTorch model: it accepts the
+    feature extractor's encoding and returns an object with ``logits`` and
+    ``pred_boxes`` tensors, ready for ``post_process_object_detection``.
+    """
+
+    def __init__(
+        self,
+        onnx_path: str,
+        providers: Optional[List[str]] = None,
+        half_precision: bool = False,
+    ):
+        """
+        Args:
+            onnx_path: Path of the exported model
+            providers: Execution providers to try, in order
+            half_precision: Let TensorRT build FP16 engines
+        """
+        import onnxruntime as ort
+
+        available = ort.get_available_providers()
+        providers = [p for p in (providers or DEFAULT_PROVIDERS) if p in available]
+        if "TensorrtExecutionProvider" in providers:
+            # Building an engine takes minutes, so engines are cached next to
+            # the model and reused by later runs (per input shape, GPU and
+            # TensorRT version)
+            trt_options = {
+                "trt_fp16_enable": half_precision,
+                "trt_engine_cache_enable": True,
+                "trt_engine_cache_path": os.path.join(
+                    os.path.dirname(os.path.abspath(onnx_path)), "trt_cache"
+                ),
+            }
+            providers = [
+                ("TensorrtExecutionProvider", trt_options)
+                if p == "TensorrtExecutionProvider"
+                else p
+                for p in providers
+            ]
+        self.session = ort.InferenceSession(onnx_path, providers=providers)
+        logger.info(
+            "Loaded ONNX model %s with providers %s",
+            onnx_path,
+            self.session.get_providers(),
+        )
+
+    def __call__(self, pixel_values: torch.Tensor, pixel_mask: torch.Tensor):
+        logits, pred_boxes = self.session.run(
+            ["logits", "pred_boxes"],
+            {
+                "pixel_values": pixel_values.numpy(),
+                "pixel_mask": pixel_mask.numpy(),
+            },
+        )
+        return SimpleNamespace(
+            logits=torch.from_numpy(logits), pred_boxes=torch.from_numpy(pred_boxes)
+        )
+
+    @staticmethod
+    def export(
+        model: torch.nn.Module,
+        onnx_path: str,
+        quantize: bool = False,
+        opset_version: int = 17,
+    ) -> str:
+        """Export a FP32 Table Transformer to ``onnx_path``.
+
+        Batch size and image height/width are dynamic, so batched and padded
+        inputs from the feature extractor can be fed as they are. With
+        ``quantize`` the weights of the exported graph are stored as int8.
+        """
+        directory = os.path.dirname(onnx_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # The wrapper is a fresh module and would otherwise be traced in
+        # training mode (dropout enabled)
+        wrapper = _DetrOutputsWrapper(model).eval()
+        device = next(model.parameters()).device
+        pixel_values = torch.zeros(1, 3, 800, 800, device=device)
+        pixel_mask = torch.ones(1, 800, 800, dtype=torch.int64, device=device)
+        export_path = onnx_path + ".fp32" if quantize else onnx_path
+
+        logger.info("Exporting ONNX model to %s", onnx_path)
+        with torch.no_grad():
+            torch.onnx.export(
+                wrapper,
+                (pixel_values, pixel_mask),
+                export_path,
+                input_names=["pixel_values", "pixel_mask"],
+                output_names=["logits", "pred_boxes"],
+                dynamic_axes={
+                    "pixel_values": {0: "batch", 2: "height", 3: "width"},
+                    "pixel_mask": {0: "batch", 1: "height", 2: "width"},
+                    "logits": {0: "batch"},
+                    "pred_boxes": {0: "batch"},
+                },
+                opset_version=opset_version,
+                dynamo=False,
+            )
+
+        if quantize:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            quantize_dynamic(export_path, onnx_path, weight_type=QuantType.QInt8)
+            os.remove(export_path)
+
+        return onnx_path
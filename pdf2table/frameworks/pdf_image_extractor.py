@@ -1,4 +1,11 @@
-import cv2
+import gzip
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Optional, Tuple
+
 import numpy as np
 import fitz
 
@@ -6,52 +13,234 @@ from pdf2table.entities.table_entities import PageImage
 from pdf2table.usecases.interfaces.framework_interfaces import (
     PDFImageExtractorInterface,
 )
+from pdf2table.frameworks.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _scale_boxes(boxes_xyxy: np.ndarray, scale_x: float, scale_y: float) -> np.ndarray:
+    """Scale (N, 4) x0, y0, x1, y1 boxes and round them to int32 pixel coordinates."""
+    scaled = boxes_xyxy * np.array([scale_x, scale_y, scale_x, scale_y])
+    return np.rint(scaled).astype(np.int32)
+
+
+class _PixmapSamples:
+    """Array interface over a pixmap's samples that keeps the pixmap alive.
+
+    ``np.asarray`` on an instance returns a zero-copy view whose base is this
+    object, so the pixmap (and its sample buffer) lives as long as the array.
+    """
+
+    def __init__(self, pix: fitz.Pixmap):
+        self._pix = pix
+        self.__array_interface__ = {
+            "shape": (pix.h, pix.w, pix.n),
+            "typestr": "|u1",
+            "data": (pix.samples_ptr, False),
+            "strides": (pix.stride, pix.n, 1),
+            "version": 3,
+        }
 
 
 class PyMuPDFImageExtractor(PDFImageExtractorInterface):
     """Concrete implementation of PDF image extraction using PyMuPDF."""
 
-    def __init__(self, dpi: int = 300):
+    def __init__(
+        self,
+        dpi: int = 300,
+        max_open_documents: int = 4,
+        preload: bool = False,
+        reuse_buffers: int = 0,
+    ):
+        """
+        Args:
+            dpi: Default render resolution
+            max_open_documents: Number of open documents kept in the cache
+            preload: Read whole PDF files into memory when opening them
+            reuse_buffers: Number of rotating output buffers. When > 0, page
+                images are views into these buffers and stay valid only until
+                ``reuse_buffers`` further pages have been rendered. 0 allocates
+                a fresh array per page
+        """
         self.dpi = dpi
+        self.max_open_documents = max_open_documents
+        # Read the whole file into memory on open (useful on network mounts)
+        self.preload = preload
+        # pdf_path -> (mtime, fitz.Document), least recently used first
+        self._doc_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # PyMuPDF documents must not be used from several threads at once
+        self._lock = threading.RLock()
+        self.reuse_buffers = reuse_buffers
+        self._buffers = [np.empty(0, dtype=np.uint8) for _ in range(reuse_buffers)]
+        self._next_buffer = 0
+        # Close whatever is still open when the extractor is garbage collected
+        weakref.finalize(self, self._close_documents, self._doc_cache)
 
-    def extract_page_image(self, pdf_path: str, page_number: int) -> PageImage:
-        """Extract image from PDF page using PyMuPDF."""
-        try:
-            doc = fitz.open(pdf_path)
-
-            if page_number >= doc.page_count or page_number < 0:
-                raise ValueError(
-                    f"Page number {page_number} is out of range for document with {doc.page_count} pages"
-                )
+    def _get_document(self, pdf_path: str) -> fitz.Document:
+        """Return a cached open document, reopening it if the file changed."""
+        mtime = os.path.getmtime(pdf_path)
+        cached = self._doc_cache.get(pdf_path)
+        if cached is not None:
+            cached_mtime, doc = cached
+            if cached_mtime == mtime:
+                self._doc_cache.move_to_end(pdf_path)
+                return doc
+            doc.close()
+            del self._doc_cache[pdf_path]
 
-            page = doc[page_number]
-            pix = page.get_pixmap(dpi=self.dpi)
+        doc = self._open_document(pdf_path)
+        self._doc_cache[pdf_path] = (mtime, doc)
+        while len(self._doc_cache) > self.max_open_documents:
+            _, (_, evicted) = self._doc_cache.popitem(last=False)
+            evicted.close()
+        return doc
 
-            # Convert to numpy array
-            img = np.frombuffer(pix.samples, dtype=np.uint8).reshape(
-                pix.h, pix.w, pix.n
-            )
+    def _open_document(self, pdf_path: str) -> fitz.Document:
+        """Open a document from disk, or from an in-memory copy of its bytes.
 
-            # Convert RGBA to RGB if necessary
-            if img.shape[2] == 4:
-                img = cv2.cvtColor(img, cv2.COLOR_RGBA2RGB)
+        Gzipped PDFs (``.gz``) are always decompressed into memory.
+        """
+        is_gzipped = pdf_path.endswith(".gz")
+        if not (self.preload or is_gzipped):
+            return fitz.open(pdf_path)
 
-            words = self.calculate_words_coordinates(page, img)
+        start_time = time.perf_counter()
+        opener = gzip.open if is_gzipped else open
+        with opener(pdf_path, "rb") as f:
+            blob = f.read()
+        logger.debug(
+            "Read %s (%d bytes) in %.3fs",
+            pdf_path, len(blob), time.perf_counter() - start_time
+        )
+        return fitz.open(stream=blob, filetype="pdf")
 
+    @staticmethod
+    def _close_documents(doc_cache: "OrderedDict[str, tuple]"):
+        for _, doc in doc_cache.values():
             doc.close()
+        doc_cache.clear()
 
-            return PageImage(
-                page_number=page_number,
-                image_data=img,
-                source_file=pdf_path,
-                words=words,
-            )
+    def close(self):
+        """Close all cached documents."""
+        with self._lock:
+            self._close_documents(self._doc_cache)
+            self._buffers = [
+                np.empty(0, dtype=np.uint8) for _ in range(self.reuse_buffers)
+            ]
 
+    def extract_page_image(
+        self,
+        pdf_path: str,
+        page_number: int,
+        dpi: Optional[int] = None,
+        include_words: bool = True,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> PageImage:
+        """Extract image from PDF page using PyMuPDF.
+
+        ``dpi`` overrides the extractor's default render resolution.
+        ``include_words=False`` skips text extraction for renders that are
+        only looked at by the models. ``clip`` limits rasterization to a
+        region of the page, given as (x0, y0, x1, y1) fractions of its width
+        and height; the image keeps the full page size, white outside it.
+        """
+        try:
+            with self._lock:
+                return self._extract_page_image(
+                    pdf_path, page_number, dpi or self.dpi, include_words, clip
+                )
         except Exception as e:
             raise RuntimeError(
                 f"Failed to extract image from page {page_number}: {str(e)}"
             )
 
+    def _extract_page_image(
+        self,
+        pdf_path: str,
+        page_number: int,
+        dpi: int,
+        include_words: bool,
+        clip: Optional[Tuple[float, float, float, float]],
+    ) -> PageImage:
+        doc = self._get_document(pdf_path)
+
+        if page_number >= doc.page_count or page_number < 0:
+            raise ValueError(
+                f"Page number {page_number} is out of range for document with {doc.page_count} pages"
+            )
+
+        page = doc[page_number]
+        if clip is not None:
+            img = self._render_clip(page, dpi, clip)
+        else:
+            # Render straight to 3-channel RGB so no RGBA->RGB pass is needed
+            pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csRGB, alpha=False)
+
+            # View the pixmap's samples in place; the view holds on to the
+            # pixmap
+            samples = np.asarray(_PixmapSamples(pix))
+            if self.reuse_buffers:
+                img = self._acquire_buffer(samples.shape)
+                np.copyto(img, samples)
+            else:
+                img = samples
+
+        words = self.calculate_words_coordinates(page, img) if include_words else []
+
+        return PageImage(
+            page_number=page_number,
+            image_data=img,
+            source_file=pdf_path,
+            words=words,
+        )
+
+    def _render_clip(
+        self, page: fitz.Page, dpi: int, clip: Tuple[float, float, float, float]
+    ) -> np.ndarray:
+        """Rasterize only the ``clip`` region into a white full-page image."""
+        matrix = fitz.Matrix(dpi / 72, dpi / 72)
+        rect = page.rect
+        x0, y0, x1, y1 = clip
+        clip_rect = fitz.Rect(
+            rect.x0 + x0 * rect.width,
+            rect.y0 + y0 * rect.height,
+            rect.x0 + x1 * rect.width,
+            rect.y0 + y1 * rect.height,
+        )
+        # Same size as an unclipped render of the page at this DPI
+        full_rect = (rect * matrix).irect
+        shape = (full_rect.height, full_rect.width, 3)
+        if self.reuse_buffers:
+            img = self._acquire_buffer(shape)
+            img.fill(255)
+        else:
+            img = np.full(shape, 255, dtype=np.uint8)
+
+        pix = page.get_pixmap(
+            matrix=matrix, clip=clip_rect, colorspace=fitz.csRGB, alpha=False
+        )
+        x, y = pix.x - full_rect.x0, pix.y - full_rect.y0
+        region = img[y:y + pix.h, x:x + pix.w]
+        if region.size:
+            region[:] = np.asarray(_PixmapSamples(pix))[
+                : region.shape[0], : region.shape[1]
+            ]
+        return img
+
+    def _acquire_buffer(self, shape: tuple) -> np.ndarray:
+        """Return a contiguous array of ``shape`` backed by the next ring buffer.
+
+        Buffers only grow, so after the largest page has been seen no further
+        page-sized allocations happen.
+        """
+        size = int(np.prod(shape))
+        idx = self._next_buffer
+        self._next_buffer = (idx + 1) % self.reuse_buffers
+        if self._buffers[idx].size < size:
+            self._buffers[idx] = np.empty(size, dtype=np.uint8)
+        return self._buffers[idx][:size].reshape(shape)
+
     def calculate_words_coordinates(self, page: fitz.Page, img: np.ndarray) -> list:
         """
         Calculates the coordinates of words on a PDF page mapped to the corresponding image pixel coordinates.
@@ -65,30 +254,24 @@ class PyMuPDFImageExtractor(PDFImageExtractorInterface):
                   and the word string (x0, y0, x1, y1, word).
         """
         words = page.get_text("words")
+        if not words:
+            return []
+
         pdf_width, pdf_height = page.rect.width, page.rect.height
         img_width, img_height = img.shape[1], img.shape[0]
 
-        def pdf_to_img_x(x):
-            return x * (img_width / pdf_width)
+        scale_x = img_width / pdf_width
+        scale_y = img_height / pdf_height
 
-        def pdf_to_img_y(y):
-            return y * (img_height / pdf_height)
+        boxes = np.array([w[:4] for w in words], dtype=np.float64)
+        boxes = _scale_boxes(boxes, scale_x, scale_y).tolist()
 
-        words_img = []
-        for w in words:
-            x0 = int(round(pdf_to_img_x(w[0])))
-            x1 = int(round(pdf_to_img_x(w[2])))
-            y1 = int(round(pdf_to_img_y(w[3])))  # due to reversion issue
-            y0 = int(round(pdf_to_img_y(w[1])))
-            words_img.append((x0, y0, x1, y1, w[4]))
-        return words_img
+        return [(*box, w[4]) for box, w in zip(boxes, words)]
 
     def get_page_count(self, pdf_path: str) -> int:
         """Get total number of pages in PDF."""
         try:
-            doc = fitz.open(pdf_path)
-            count = doc.page_count
-            doc.close()
-            return count
+            with self._lock:
+                return self._get_document(pdf_path).page_count
         except Exception as e:
             raise RuntimeError(f"Failed to get page count: {str(e)}")
@@ -0,0 +1,227 @@
+"""
+PDF page rendering with PDFium (via pypdfium2).
+
+pypdfium2 is optional: it is only imported when a ``PdfiumImageExtractor`` is
+created. PDFium calls go through ctypes, which releases the GIL for their
+duration, so a page rendered in the use case's prefetch thread no longer
+stalls the Python work on the current page.
+"""
+
+import math
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from pdf2table.entities.table_entities import PageImage
+from pdf2table.usecases.interfaces.framework_interfaces import (
+    PDFImageExtractorInterface,
+)
+from pdf2table.frameworks.pdf_image_extractor import _scale_boxes
+from pdf2table.frameworks.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class PdfiumImageExtractor(PDFImageExtractorInterface):
+    """Concrete implementation of PDF image extraction using PDFium."""
+
+    def __init__(self, dpi: int = 300, max_open_documents: int = 4):
+        """
+        Args:
+            dpi: Default render resolution
+            max_open_documents: Number of open documents kept in the cache
+        """
+        import pypdfium2
+        import pypdfium2.raw as pdfium_c
+
+        self._pdfium = pypdfium2
+        self._pdfium_c = pdfium_c
+        self.dpi = dpi
+        self.max_open_documents = max_open_documents
+        # pdf_path -> (mtime, PdfDocument), least recently used first
+        self._doc_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        # PDFium is not thread-safe, even across documents: calls are
+        # serialized, the GIL being released while each one runs
+        self._lock = threading.RLock()
+        weakref.finalize(self, self._close_documents, self._doc_cache)
+
+    def _get_document(self, pdf_path: str):
+        """Return a cached open document, reopening it if the file changed."""
+        mtime = os.path.getmtime(pdf_path)
+        cached = self._doc_cache.get(pdf_path)
+        if cached is not None:
+            cached_mtime, doc = cached
+            if cached_mtime == mtime:
+                self._doc_cache.move_to_end(pdf_path)
+                return doc
+            doc.close()
+            del self._doc_cache[pdf_path]
+
+        doc = self._pdfium.PdfDocument(pdf_path)
+        self._doc_cache[pdf_path] = (mtime, doc)
+        while len(self._doc_cache) > self.max_open_documents:
+            _, (_, evicted) = self._doc_cache.popitem(last=False)
+            evicted.close()
+        return doc
+
+    @staticmethod
+    def _close_documents(doc_cache: "OrderedDict[str, tuple]"):
+        for _, doc in doc_cache.values():
+            doc.close()
+        doc_cache.clear()
+
+    def close(self):
+        """Close all cached documents."""
+        with self._lock:
+            self._close_documents(self._doc_cache)
+
+    def extract_page_image(
+        self,
+        pdf_path: str,
+        page_number: int,
+        dpi: Optional[int] = None,
+        include_words: bool = True,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> PageImage:
+        """Extract image from PDF page using PDFium.
+
+        Arguments behave as in ``PyMuPDFImageExtractor.extract_page_image``.
+        """
+        try:
+            with self._lock:
+                return self._extract_page_image(
+                    pdf_path, page_number, dpi or self.dpi, include_words, clip
+                )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to extract image from page {page_number}: {str(e)}"
+            )
+
+    def _extract_page_image(
+        self,
+        pdf_path: str,
+        page_number: int,
+        dpi: int,
+        include_words: bool,
+        clip: Optional[Tuple[float, float, float, float]],
+    ) -> PageImage:
+        doc = self._get_document(pdf_path)
+
+        if page_number >= len(doc) or page_number < 0:
+            raise ValueError(
+                f"Page number {page_number} is out of range for document with {len(doc)} pages"
+            )
+
+        page = doc[page_number]
+        try:
+            scale = dpi / 72
+            if clip is not None:
+                img = self._render_clip(page, scale, clip)
+            else:
+                # rev_byteorder renders RGB rather than PDFium's native BGR
+                img = page.render(scale=scale, rev_byteorder=True).to_numpy()
+
+            words = self.calculate_words_coordinates(page, img) if include_words else []
+        finally:
+            page.close()
+
+        return PageImage(
+            page_number=page_number,
+            image_data=img,
+            source_file=pdf_path,
+            words=words,
+        )
+
+    @staticmethod
+    def _render_clip(page, scale: float, clip: Tuple[float, float, float, float]) -> np.ndarray:
+        """Rasterize only the ``clip`` region into a white full-page image."""
+        width, height = page.get_size()
+        x0, y0, x1, y1 = clip
+        # PDFium crops are margins (left, bottom, right, top) in PDF units
+        crop = (x0 * width, (1 - y1) * height, (1 - x1) * width, y0 * height)
+        # Same size and crop offsets as PDFium computes for the render
+        shape = (math.ceil(height * scale), math.ceil(width * scale), 3)
+        img = np.full(shape, 255, dtype=np.uint8)
+
+        region = page.render(scale=scale, crop=crop, rev_byteorder=True).to_numpy()
+        x, y = math.ceil(crop[0] * scale), math.ceil(crop[3] * scale)
+        img[y:y + region.shape[0], x:x + region.shape[1]] = region
+        return img
+
+    def calculate_words_coordinates(self, page, img: np.ndarray) -> List[tuple]:
+        """
+        Calculates the coordinates of words on a PDF page mapped to the corresponding image pixel coordinates.
+
+        Words are runs of non-whitespace characters in the page's text order.
+
+        Args:
+            page (pypdfium2.PdfPage): The PDF page object.
+            img (np.ndarray): The image array representing the rendered PDF page.
+
+        Returns:
+            list: A list of tuples (x0, y0, x1, y1, word) with the bounding box in image pixels.
+        """
+        pdfium_c = self._pdfium_c
+        textpage = page.get_textpage()
+        try:
+            n_chars = textpage.count_chars()
+            if n_chars <= 0:
+                return []
+
+            codes = [pdfium_c.FPDFText_GetUnicode(textpage, i) for i in range(n_chars)]
+            words, boxes, chars, box = [], [], [], None
+            for i, code in enumerate(codes):
+                char = chr(code) if code else " "
+                if char.isspace():
+                    if chars:
+                        words.append("".join(chars))
+                        boxes.append(box)
+                        chars, box = [], None
+                    continue
+                left, bottom, right, top = textpage.get_charbox(i, loose=True)
+                chars.append(char)
+                if box is None:
+                    box = [left, bottom, right, top]
+                else:
+                    box = [
+                        min(box[0], left), min(box[1], bottom),
+                        max(box[2], right), max(box[3], top),
+                    ]
+            if chars:
+                words.append("".join(chars))
+                boxes.append(box)
+        finally:
+            textpage.close()
+
+        if not words:
+            return []
+
+        pdf_width, pdf_height = page.get_size()
+        scale_x = img.shape[1] / pdf_width
+        scale_y = img.shape[0] / pdf_height
+
+        # Character boxes are in page space, where y grows upwards; image
+        # pixels start at the top left corner of the visible page box.
+        # get_bbox resolves the crop box against the media box, inherited
+        # from the page tree when the page has none of its own; get_cropbox
+        # would fall back to US Letter for such pages
+        crop_left, _, _, crop_top = page.get_bbox()
+        boxes = np.array(boxes, dtype=np.float64)
+        boxes[:, [0, 2]] -= crop_left
+        boxes[:, [1, 3]] = crop_top - boxes[:, [3, 1]]
+        boxes = _scale_boxes(boxes, scale_x, scale_y).tolist()
+
+        return [(*box, word) for box, word in zip(boxes, words)]
+
+    def get_page_count(self, pdf_path: str) -> int:
+        """Get total number of pages in PDF."""
+        try:
+            with self._lock:
+                return len(self._get_document(pdf_path))
+        except Exception as e:
+            raise RuntimeError(f"Failed to get page count: {str(e)}")
@@ -1,11 +1,15 @@
+import hashlib
+import os
+from functools import partial
 from typing import Optional
+
+from pdf2table.usecases.dtos import TableExtractionResponse
 from pdf2table.usecases.table_extraction_use_case import TableExtractionUseCase
-from pdf2table.frameworks.pdf_image_extractor import PyMuPDFImageExtractor
-from pdf2table.frameworks.table_transformer_detector import TableTransformerDetector
-from pdf2table.frameworks.table_structure_recognizer import (
-    TableTransformerStructureRecognizer,
+from pdf2table.usecases.interfaces.framework_interfaces import (
+    OCRInterface,
+    PDFImageExtractorInterface,
 )
-from pdf2table.frameworks.ocr_service import TrOCRService
+from pdf2table.frameworks.pdf_image_extractor import PyMuPDFImageExtractor
 from pdf2table.frameworks.logging_config import get_logger
 
 
@@ -17,9 +21,21 @@ def create_pipeline(
     detection_threshold: float = 0.9,
     structure_threshold: float = 0.6,
     pdf_dpi: int = 300,
+    detection_dpi: Optional[int] = 150,
+    detection_batch_size: Optional[int] = None,
     load_ocr: bool = False,
     visualize: bool = False,
     visualization_save_dir: str = "data/table_visualizations",
+    num_workers: int = 1,
+    page_cache_size: int = 0,
+    page_cache_dir: Optional[str] = None,
+    ocr_cache_size: int = 4096,
+    quantize: bool = False,
+    onnx_dir: Optional[str] = None,
+    torchscript_dir: Optional[str] = None,
+    pdf_backend: str = "pymupdf",
+    precision: str = "fp16",
+    compile_models: bool = False,
 ) -> TableExtractionUseCase:
     """
     Create a fully configured table extraction pipeline.
@@ -28,38 +44,121 @@ def create_pipeline(
         device: Device to use for ML models ('cpu' or 'cuda')
         detection_threshold: Confidence threshold for table detection
         structure_threshold: Confidence threshold for structure recognition
-        pdf_dpi: DPI for PDF page rendering
+        pdf_dpi: DPI for PDF page rendering used by structure recognition and OCR
+        detection_dpi: DPI for the page rendered for table detection. The page
+            is only rendered at pdf_dpi when a table is found. None (or a value
+            not lower than pdf_dpi) renders once at pdf_dpi
+        detection_batch_size: Pages per table detection batch when extracting
+            all pages of a document. None batches 8 pages on CUDA and runs
+            pages one by one on CPU, where batching gains little
         load_ocr: Whether to load OCR service
         visualize: Whether to enable visualization
         visualization_save_dir: Directory to save visualizations
+        num_workers: Number of worker processes used when extracting all pages
+            of a document. Each worker loads its own models; 1 runs in-process
+        page_cache_size: Number of pages whose results are kept and reused
+            until the PDF file changes. 0 disables caching
+        page_cache_dir: Directory where page results are stored and reused
+            across runs, keyed by the PDF's content and the settings below
+            that affect the results. Entries are unpickled, so only use a
+            trusted directory. None disables it
+        ocr_cache_size: Number of OCR results kept per pipeline, keyed by the
+            cell crop's pixels, so repeated cells (headers, empty or yes/no
+            cells) are OCRed once. 0 disables caching
+        quantize: Apply int8 dynamic quantization to the models on CPU
+        onnx_dir: Directory of exported ONNX Table Transformer models. When
+            set, detection and structure recognition run with onnxruntime;
+            missing models are exported there on first use
+        torchscript_dir: Directory of traced TorchScript models, used like
+            onnx_dir (which takes precedence). Traces are specific to the
+            device and precision and are named after them
+        pdf_backend: Page renderer, "pymupdf" or "pdfium" (requires pypdfium2)
+        precision: Inference precision of the PyTorch models. "fp16" runs FP16
+            weights on CUDA (FP32 on CPU), "bf16" runs the Table Transformer
+            models under bf16 autocast (unless quantized), "fp32" keeps full
+            precision
+        compile_models: Compile the PyTorch models with torch.compile at load
+            time (compilation warms up on a blank input and falls back to
+            eager on failure). Ignored for ONNX or TorchScript models
 
     Returns:
         TableExtractionUseCase: Configured use case ready for table extraction
     """
+    if precision not in ("fp16", "bf16", "fp32"):
+        raise ValueError(f"Unknown precision: {precision}")
+
     logger.info(
-        f"Creating table extraction pipeline - Device: {device}, "
-        f"Detection threshold: {detection_threshold}, "
-        f"Structure threshold: {structure_threshold}, "
-        f"PDF DPI: {pdf_dpi}, OCR: {load_ocr}, Visualize: {visualize}"
+        "Creating table extraction pipeline - Device: %s, "
+        "Detection threshold: %s, Structure threshold: %s, "
+        "PDF DPI: %s, Detection DPI: %s, OCR: %s, Visualize: %s, Workers: %s",
+        device,
+        detection_threshold,
+        structure_threshold,
+        pdf_dpi,
+        detection_dpi,
+        load_ocr,
+        visualize,
+        num_workers,
+    )
+
+    logger.debug("Initializing PDF image extractor (%s)", pdf_backend)
+    pdf_extractor = _create_pdf_extractor(pdf_backend, pdf_dpi)
+
+    # torch/transformers are imported here rather than at module level so that
+    # importing this module stays cheap until a pipeline is actually built
+    from pdf2table.frameworks.table_transformer_detector import (
+        TableTransformerDetector,
+    )
+    from pdf2table.frameworks.table_structure_recognizer import (
+        TableTransformerStructureRecognizer,
     )
 
-    logger.debug("Initializing PDF image extractor")
-    pdf_extractor = PyMuPDFImageExtractor(dpi=pdf_dpi)
+    if device.startswith("cuda"):
+        import torch
+
+        # Let FP32 matmuls (e.g. under bf16 or fp32 precision) use TF32
+        torch.set_float32_matmul_precision("high")
 
     logger.debug("Initializing table transformer detector")
     table_detector = TableTransformerDetector(
-        device=device, confidence_threshold=detection_threshold
+        device=device,
+        confidence_threshold=detection_threshold,
+        quantize=quantize,
+        onnx_path=_onnx_path(onnx_dir, "table-detection", quantize),
+        torchscript_path=_torchscript_path(
+            torchscript_dir, "table-detection", device, quantize, precision
+        ),
+        half_precision=precision == "fp16",
+        bf16_autocast=precision == "bf16" and not quantize,
+        compile_model=compile_models,
     )
 
     logger.debug("Initializing table structure recognizer")
     structure_recognizer = TableTransformerStructureRecognizer(
-        device=device, confidence_threshold=structure_threshold
+        device=device,
+        confidence_threshold=structure_threshold,
+        quantize=quantize,
+        shared_feature_extractor=table_detector.feature_extractor,
+        onnx_path=_onnx_path(onnx_dir, "table-structure", quantize),
+        torchscript_path=_torchscript_path(
+            torchscript_dir, "table-structure", device, quantize, precision
+        ),
+        half_precision=precision == "fp16",
+        bf16_autocast=precision == "bf16" and not quantize,
+        compile_model=compile_models,
     )
 
-    ocr_service: Optional[TrOCRService] = None
+    ocr_service: Optional[OCRInterface] = None
     if load_ocr:
+        from pdf2table.frameworks.ocr_service import TrOCRService
+
         logger.debug("Initializing OCR service")
-        ocr_service = TrOCRService(device=device)
+        ocr_service = TrOCRService(
+            device=device,
+            quantize=quantize,
+            half_precision=precision == "fp16",
+            compile_model=compile_models,
+        )
     else:
         logger.debug("OCR service disabled")
 
@@ -71,7 +170,195 @@ def create_pipeline(
         ocr_service=ocr_service,
         visualize=visualize,
         visualization_save_dir=visualization_save_dir,
+        # On GPU, detecting the next page while the current one is in
+        # structure recognition keeps the device busy
+        prefetch_detection=device.startswith("cuda"),
+        detection_dpi=(
+            detection_dpi
+            if detection_dpi is not None and detection_dpi < pdf_dpi
+            else None
+        ),
+        detection_batch_size=(
+            detection_batch_size
+            if detection_batch_size is not None
+            else (8 if device.startswith("cuda") else 1)
+        ),
+        num_workers=num_workers,
+        page_cache_size=page_cache_size,
+        ocr_cache_size=ocr_cache_size,
+        page_cache_dir=page_cache_dir,
+        page_cache_tag=_settings_tag(
+            device=device,
+            detection_threshold=detection_threshold,
+            structure_threshold=structure_threshold,
+            pdf_dpi=pdf_dpi,
+            detection_dpi=detection_dpi,
+            load_ocr=load_ocr,
+            quantize=quantize,
+            onnx=onnx_dir is not None,
+            torchscript=torchscript_dir is not None,
+            pdf_backend=pdf_backend,
+            precision=precision,
+        ),
+        # The models were just loaded here, so they are in the local
+        # Hugging Face cache for the workers
+        worker_factory=_worker_factory(
+            num_workers,
+            models_cached=True,
+            device=device,
+            detection_threshold=detection_threshold,
+            structure_threshold=structure_threshold,
+            pdf_dpi=pdf_dpi,
+            detection_dpi=detection_dpi,
+            detection_batch_size=detection_batch_size,
+            load_ocr=load_ocr,
+            visualize=visualize,
+            visualization_save_dir=visualization_save_dir,
+            ocr_cache_size=ocr_cache_size,
+            quantize=quantize,
+            onnx_dir=onnx_dir,
+            torchscript_dir=torchscript_dir,
+            pdf_backend=pdf_backend,
+            precision=precision,
+            compile_models=compile_models,
+        ),
     )
 
     logger.info("Table extraction pipeline created successfully")
     return use_case
+
+
+def _create_pdf_extractor(pdf_backend: str, dpi: int) -> PDFImageExtractorInterface:
+    """Build the page renderer named by ``pdf_backend``."""
+    if pdf_backend == "pymupdf":
+        return PyMuPDFImageExtractor(dpi=dpi)
+    if pdf_backend == "pdfium":
+        from pdf2table.frameworks.pdfium_image_extractor import PdfiumImageExtractor
+
+        return PdfiumImageExtractor(dpi=dpi)
+    raise ValueError(f"Unknown PDF backend: {pdf_backend}")
+
+
+def _settings_tag(**settings) -> str:
+    """Short digest of the settings page results depend on."""
+    text = repr(sorted(settings.items()))
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _onnx_path(onnx_dir: Optional[str], name: str, quantize: bool) -> Optional[str]:
+    """Path of an exported model in ``onnx_dir``, None when ONNX is not used."""
+    if onnx_dir is None:
+        return None
+    suffix = "-int8" if quantize else ""
+    return os.path.join(onnx_dir, f"{name}{suffix}.onnx")
+
+
+def _torchscript_path(
+    torchscript_dir: Optional[str],
+    name: str,
+    device: str,
+    quantize: bool,
+    precision: str,
+) -> Optional[str]:
+    """Path of a traced model in ``torchscript_dir``, None when not used."""
+    if torchscript_dir is None:
+        return None
+    if device.startswith("cuda"):
+        variant = "cuda-fp16" if precision == "fp16" else "cuda"
+    else:
+        variant = "cpu-int8" if quantize else "cpu"
+    return os.path.join(torchscript_dir, f"{name}-{variant}.pt")
+
+
+def _worker_factory(
+    num_workers: int, models_cached: bool = False, **pipeline_kwargs
+):
+    """Return a picklable callable that builds a pipeline inside a worker.
+
+    ``models_cached`` tells the workers the models are already in the local
+    Hugging Face cache.
+    """
+    if num_workers <= 1:
+        return None
+    num_threads = max(1, (os.cpu_count() or 1) // num_workers)
+    return partial(
+        _create_worker_pipeline, pipeline_kwargs, num_threads, models_cached
+    )
+
+
+def _create_worker_pipeline(
+    pipeline_kwargs: dict, num_threads: int, models_cached: bool = False
+) -> TableExtractionUseCase:
+    """Build a single-process pipeline in a worker, sharing the CPU fairly."""
+    if pipeline_kwargs.get("device", "cpu") == "cpu":
+        os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    if models_cached:
+        # Load from the local cache without the Hub's per-file HTTP checks;
+        # read when transformers is first imported, which happens below
+        os.environ.setdefault("HF_HUB_OFFLINE", "1")
+
+    import torch
+
+    torch.set_num_threads(num_threads)
+    return create_pipeline(**pipeline_kwargs)
+
+
+def extract_tables_parallel(
+    pdf_path: str,
+    num_workers: Optional[int] = None,
+    min_pages_per_worker: int = 4,
+    **pipeline_kwargs,
+) -> TableExtractionResponse:
+    """
+    Extract tables from all pages of a PDF using a pool of worker processes.
+
+    Each worker builds its own pipeline (see ``create_pipeline``) once at
+    startup and then processes whole pages. Intended for CPU deployments,
+    where pages are independent and the GIL prevents threads from scaling.
+    Unlike ``create_pipeline(num_workers=...)``, no models are loaded in the
+    calling process.
+
+    Args:
+        pdf_path: Path to the PDF file
+        num_workers: Maximum number of worker processes. Defaults to the CPU
+            count
+        min_pages_per_worker: Pages each worker should get to make up for
+            loading its models; short documents use fewer workers, or run
+            in-process
+        **pipeline_kwargs: Keyword arguments forwarded to ``create_pipeline``
+
+    Returns:
+        TableExtractionResponse with tables ordered by page number
+    """
+    if pipeline_kwargs.get("visualize"):
+        raise ValueError("Visualization is not supported in parallel extraction")
+
+    num_workers = num_workers or os.cpu_count() or 1
+    # The coordinating use case only needs to count pages; the models live
+    # in the workers. Its extractor keeps the document open between the
+    # count below and the extraction
+    pdf_extractor = PyMuPDFImageExtractor()
+    try:
+        page_count = pdf_extractor.get_page_count(pdf_path)
+        num_workers = min(
+            num_workers, max(1, page_count // max(1, min_pages_per_worker))
+        )
+    except RuntimeError:
+        # Reported by the use case below
+        pass
+
+    if num_workers <= 1:
+        pdf_extractor.close()
+        return create_pipeline(**pipeline_kwargs).extract_tables(pdf_path)
+
+    logger.info("Extracting %s with %d workers", pdf_path, num_workers)
+
+    coordinator = TableExtractionUseCase(
+        pdf_extractor=pdf_extractor,
+        table_detector=None,
+        structure_recognizer=None,
+        ocr_service=None,
+        num_workers=num_workers,
+        worker_factory=_worker_factory(num_workers, **pipeline_kwargs),
+    )
+    return coordinator.extract_tables(pdf_path)
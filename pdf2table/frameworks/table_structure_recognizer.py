@@ -1,31 +1,65 @@
 import torch
 import numpy as np
-from typing import List
+from typing import List, Optional
 from transformers import DetrFeatureExtractor, TableTransformerForObjectDetection
 
 from pdf2table.entities.table_entities import PageImage, DetectedCell, BoundingBox
 from pdf2table.usecases.interfaces.framework_interfaces import TableStructureRecognizerInterface
+from pdf2table.frameworks.table_transformer_runtime import TableTransformerRuntime
 
 
-class TableTransformerStructureRecognizer(TableStructureRecognizerInterface):
+class TableTransformerStructureRecognizer(
+    TableTransformerRuntime, TableStructureRecognizerInterface
+):
     """Concrete implementation of table structure recognition using Microsoft Table Transformer."""
     
     def __init__(
         self,
         model_name: str = "microsoft/table-transformer-structure-recognition-v1.1-all",
         device: str = "cpu",
-        confidence_threshold: float = 0.6
+        confidence_threshold: float = 0.6,
+        half_precision: bool = True,
+        quantize: bool = False,
+        crop_cells: bool = False,
+        shared_feature_extractor: Optional[DetrFeatureExtractor] = None,
+        onnx_path: Optional[str] = None,
+        torchscript_path: Optional[str] = None,
+        max_batch_size: int = 8,
+        min_table_size: int = 32,
+        compile_model: bool = False,
+        bf16_autocast: bool = False
     ):
-        self.model = TableTransformerForObjectDetection.from_pretrained(model_name)
-        self.feature_extractor = DetrFeatureExtractor.from_pretrained(model_name)
-        self.feature_extractor.size["shortest_edge"] = 800
-        
-        self.device = device
+        self.feature_extractor = self._load_feature_extractor(
+            model_name, shared_feature_extractor
+        )
+        # Structure crops are resized per call, so a feature extractor
+        # shared with the detector keeps its own resize settings
+        self._resize = {**self.feature_extractor.size, "shortest_edge": 800}
+
         self.confidence_threshold = confidence_threshold
-        
-        self.model.to(self.device)
-        self.model.eval()
-        
+        # Optionally attach a view of the table image to every DetectedCell.
+        # Off by default: the views keep the whole page image alive, and the
+        # grid builder crops from the page image itself
+        self.crop_cells = crop_cells
+        # Upper bound on the number of tables per forward pass
+        self.max_batch_size = max(1, max_batch_size)
+        # Crops thinner than this (in pixels) can't hold a grid of rows and
+        # columns and are not run through the model
+        self.min_table_size = min_table_size
+
+        self._init_runtime(
+            TableTransformerForObjectDetection.from_pretrained(model_name),
+            self.feature_extractor,
+            device=device,
+            half_precision=half_precision,
+            quantize=quantize,
+            onnx_path=onnx_path,
+            torchscript_path=torchscript_path,
+            compile_model=compile_model,
+            bf16_autocast=bf16_autocast,
+            preprocess_size=self._resize,
+        )
+
         # Relevant cell types for table structure
         self.relevant_cell_types = {
             "table column",
@@ -35,73 +69,127 @@ class TableTransformerStructureRecognizer(TableStructureRecognizerInterface):
             "table spanning cell"
         }
     
+    @staticmethod
+    def _load_feature_extractor(
+        model_name: str, shared: Optional[DetrFeatureExtractor]
+    ) -> DetrFeatureExtractor:
+        """Reuse ``shared`` if it preprocesses exactly like this checkpoint's
+        own feature extractor (resizing aside), otherwise load our own."""
+        if shared is not None:
+            config, _ = DetrFeatureExtractor.get_image_processor_dict(model_name)
+            shared_config = shared.to_dict()
+            if all(
+                shared_config.get(key) == value
+                for key, value in config.items()
+                if key not in ("size", "image_processor_type", "_processor_class")
+            ):
+                return shared
+        return DetrFeatureExtractor.from_pretrained(model_name)
+
     def recognize_structure(self, page_image: PageImage, table_box: BoundingBox) -> List[DetectedCell]:
         """Recognize structure of a detected table."""
+        return self.recognize_structures_batch(page_image, [table_box])[0]
+
+    def recognize_structures_batch(
+        self, page_image: PageImage, table_boxes: List[BoundingBox]
+    ) -> List[List[DetectedCell]]:
+        """Recognize structure of several tables with batched forward passes."""
+        if not table_boxes:
+            return []
+
         try:
-            # Crop table region from page image
-            table_image = self._crop_table_image(page_image.image_data, table_box)
-            
-            # Prepare input
-            encoding = self.feature_extractor(
-                images=table_image,
-                return_tensors="pt"
-            )
-            
-            # Move to device
-            for k, v in encoding.items():
-                encoding[k] = v.to(self.device)
+            # Crop table regions from page image
+            table_images = [
+                self._crop_table_image(page_image.image_data, table_box)
+                for table_box in table_boxes
+            ]
             
-            # Run inference
-            with torch.no_grad():
-                outputs = self.model(**encoding)
-            
-            # Post-process results
-            results = self.feature_extractor.post_process_object_detection(
-                outputs,
-                threshold=self.confidence_threshold,
-                target_sizes=[(table_image.shape[0], table_image.shape[1])],
-            )[0]
-            
-            # Convert to domain objects
-            detected_cells = []
-            for score, label, box in zip(
-                results["scores"], 
-                results["labels"], 
-                results["boxes"]
-            ):
-                label_name = self.model.config.id2label[label.item()]
-                
-                # Only process relevant cell types
-                if label_name in self.relevant_cell_types:
-                    box_coords = [round(i) for i in box.tolist()]
-                    
-                    # Convert relative coordinates to absolute coordinates
-                    abs_box = BoundingBox(
-                        x_min=box_coords[0] + table_box.x_min,
-                        y_min=box_coords[1] + table_box.y_min,
-                        x_max=box_coords[2] + table_box.x_min,
-                        y_max=box_coords[3] + table_box.y_min
-                    )
-                    
-                    # Extract cell image crop
-                    cell_crop = table_image[
-                        box_coords[1]:box_coords[3], 
-                        box_coords[0]:box_coords[2]
-                    ]
-                    
-                    detected_cell = DetectedCell(
-                        box=abs_box,
-                        cell_type=label_name,
-                        confidence_score=score.item(),
-                        image_crop=cell_crop
+            # Slivers get no cells; the other tables are run in chunks of
+            # max_batch_size to bound the memory of the padded batch
+            min_size = self.min_table_size
+            recognized = [
+                idx for idx, table_image in enumerate(table_images)
+                if min(table_image.shape[:2]) >= min_size
+            ]
+            cells_per_table = [[] for _ in table_images]
+            for start in range(0, len(recognized), self.max_batch_size):
+                chunk = recognized[start:start + self.max_batch_size]
+                results = self._detect_cells([table_images[idx] for idx in chunk])
+                for idx, table_result in zip(chunk, results):
+                    cells_per_table[idx] = self._to_detected_cells(
+                        table_result, table_images[idx], table_boxes[idx]
                     )
-                    
-                    detected_cells.append(detected_cell)
             
-            return detected_cells
+            return cells_per_table
             
         except Exception as e:
             raise RuntimeError(f"Table structure recognition failed: {str(e)}")
+
+    def _detect_cells(self, table_images: List[np.ndarray]) -> List[dict]:
+        """Run one forward pass over table crops, one result dict per crop."""
+        outputs = self._run_model(table_images)
+        
+        # Post-process results, one entry per table
+        return self.feature_extractor.post_process_object_detection(
+            outputs,
+            threshold=self.confidence_threshold,
+            target_sizes=[
+                (table_image.shape[0], table_image.shape[1])
+                for table_image in table_images
+            ],
+        )
+
+    def _to_detected_cells(
+        self, results: dict, table_image: np.ndarray, table_box: BoundingBox
+    ) -> List[DetectedCell]:
+        """Convert post-processed detections of one table to domain objects."""
+        id2label = self.model.config.id2label
+        relevant_label_ids = [
+            label_id for label_id, label_name in id2label.items()
+            if label_name in self.relevant_cell_types
+        ]
+
+        # Filter, clip and offset the detections as whole arrays; the kept
+        # boxes are valid by construction and skip per-field validation.
+        # DetectedCell objects are only built for kept cells
+        height, width = table_image.shape[:2]
+        labels = results["labels"].numpy()
+        rel_boxes = results["boxes"].round().to(torch.int32).numpy()
+        np.clip(rel_boxes[:, 0::2], 0, width, out=rel_boxes[:, 0::2])
+        np.clip(rel_boxes[:, 1::2], 0, height, out=rel_boxes[:, 1::2])
+        keep = (
+            np.isin(labels, relevant_label_ids)
+            & (rel_boxes[:, 2] > rel_boxes[:, 0])
+            & (rel_boxes[:, 3] > rel_boxes[:, 1])
+        )
+        labels = labels[keep].tolist()
+        scores = results["scores"].numpy()[keep].tolist()
+        rel_boxes = rel_boxes[keep]
+        offset = np.array(
+            [table_box.x_min, table_box.y_min, table_box.x_min, table_box.y_min],
+            dtype=np.int32
+        )
+        abs_boxes = (rel_boxes + offset).tolist()
+        rel_boxes = rel_boxes.tolist()
+
+        crop_cells = self.crop_cells
+        detected_cells = []
+        for score, label, (x_min, y_min, x_max, y_max), abs_coords in zip(
+            scores, labels, rel_boxes, abs_boxes
+        ):
+            detected_cells.append(
+                DetectedCell(
+                    box=BoundingBox._trusted(*abs_coords),
+                    cell_type=id2label[label],
+                    confidence_score=score,
+                    # Cell image crop, a view of the table image
+                    image_crop=(
+                        table_image[y_min:y_max, x_min:x_max] if crop_cells else None
+                    )
+                )
+            )
+        
+        return detected_cells
     
     def _crop_table_image(self, page_image: np.ndarray, table_box: BoundingBox) -> np.ndarray:
         """Crop table region from page image."""
@@ -122,9 +210,3 @@ class TableTransformerStructureRecognizer(TableStructureRecognizerInterface):
             
         except Exception as e:
             raise RuntimeError(f"Failed to crop table image: {str(e)}")
-    
-    def set_confidence_threshold(self, threshold: float):
-        """Update confidence threshold."""
-        if not 0 <= threshold <= 1:
-            raise ValueError("Confidence threshold must be between 0 and 1")
-        self.confidence_threshold = threshold
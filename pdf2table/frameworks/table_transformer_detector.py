@@ -1,84 +1,112 @@
 import torch
-from typing import List
+import numpy as np
+from typing import List, Optional
 from transformers import DetrFeatureExtractor, TableTransformerForObjectDetection
 
 from pdf2table.entities.table_entities import PageImage, DetectedTable, BoundingBox
 from pdf2table.usecases.interfaces.framework_interfaces import TableDetectorInterface
+from pdf2table.frameworks.table_transformer_runtime import TableTransformerRuntime
 
 
-class TableTransformerDetector(TableDetectorInterface):
+class TableTransformerDetector(TableTransformerRuntime, TableDetectorInterface):
     """Concrete implementation of table detection using Microsoft Table Transformer."""
     
     def __init__(
         self, 
         model_name: str = "microsoft/table-transformer-detection",
         device: str = "cpu",
-        confidence_threshold: float = 0.9
+        confidence_threshold: float = 0.9,
+        half_precision: bool = True,
+        quantize: bool = False,
+        onnx_path: Optional[str] = None,
+        torchscript_path: Optional[str] = None,
+        max_batch_size: int = 8,
+        compile_model: bool = False,
+        bf16_autocast: bool = False
     ):
-        self.model = TableTransformerForObjectDetection.from_pretrained(model_name)
         self.feature_extractor = DetrFeatureExtractor.from_pretrained(model_name)
-        self.device = device
         self.confidence_threshold = confidence_threshold
-        
-        self.model.to(self.device)
-        self.model.eval()
-    
+        # Upper bound on the number of pages per forward pass
+        self.max_batch_size = max(1, max_batch_size)
+
+        self._init_runtime(
+            TableTransformerForObjectDetection.from_pretrained(model_name),
+            self.feature_extractor,
+            device=device,
+            half_precision=half_precision,
+            quantize=quantize,
+            onnx_path=onnx_path,
+            torchscript_path=torchscript_path,
+            compile_model=compile_model,
+            bf16_autocast=bf16_autocast,
+        )
+
     def detect_tables(self, page_image: PageImage) -> List[DetectedTable]:
         """Detect tables in a page image using Table Transformer."""
+        return self.detect_tables_batch([page_image])[0]
+
+    def detect_tables_batch(
+        self, page_images: List[PageImage]
+    ) -> List[List[DetectedTable]]:
+        """Detect tables in several page images with batched forward passes."""
+        if not page_images:
+            return []
+
         try:
-            # Prepare input
-            encoding = self.feature_extractor(
-                images=page_image.image_data, 
-                return_tensors="pt"
-            )
-            
-            # Move to device
-            for k, v in encoding.items():
-                encoding[k] = v.to(self.device)
-            
-            # Run inference
-            with torch.no_grad():
-                outputs = self.model(**encoding)
-            
-            # Post-process results
-            results = self.feature_extractor.post_process_object_detection(
-                outputs,
-                threshold=self.confidence_threshold,
-                target_sizes=[page_image.dimensions],
-            )[0]
-            
-            # Convert to domain objects
+            # Pages are run in chunks of max_batch_size to bound the memory
+            # of the padded batch
             detected_tables = []
-            for score, label, box in zip(
-                results["scores"], 
-                results["labels"], 
-                results["boxes"]
-            ):
-                box_coords = [round(i) for i in box.tolist()]
-                
-                detection_box = BoundingBox(
-                    x_min=box_coords[0],
-                    y_min=box_coords[1],
-                    x_max=box_coords[2],
-                    y_max=box_coords[3]
-                )
-                
-                detected_table = DetectedTable(
-                    detection_box=detection_box,
-                    confidence_score=score.item(),
-                    page_number=page_image.page_number,
-                    source_file=page_image.source_file
+            for start in range(0, len(page_images), self.max_batch_size):
+                detected_tables.extend(
+                    self._detect_pages(page_images[start:start + self.max_batch_size])
                 )
-                
-                detected_tables.append(detected_table)
-            
             return detected_tables
             
         except Exception as e:
             raise RuntimeError(f"Table detection failed: {str(e)}")
-    
-    def set_confidence_threshold(self, threshold: float):
-        """Update confidence threshold."""
-        if not 0 <= threshold <= 1:
-            raise ValueError("Confidence threshold must be between 0 and 1")
-        self.confidence_threshold = threshold
+
+    def _detect_pages(self, page_images: List[PageImage]) -> List[List[DetectedTable]]:
+        """Run one forward pass over page images, one table list per page."""
+        outputs = self._run_model(
+            [page_image.image_data for page_image in page_images]
+        )
+        
+        # Post-process results, one entry per page
+        results = self.feature_extractor.post_process_object_detection(
+            outputs,
+            threshold=self.confidence_threshold,
+            target_sizes=[page_image.dimensions for page_image in page_images],
+        )
+        return [
+            self._to_detected_tables(page_results, page_image)
+            for page_results, page_image in zip(results, page_images)
+        ]
+
+    def _to_detected_tables(
+        self, results: dict, page_image: PageImage
+    ) -> List[DetectedTable]:
+        """Convert post-processed detections of one page to domain objects."""
+        # Clip the boxes to the page and drop empty ones as whole arrays;
+        # the boxes are then valid by construction and skip per-field
+        # validation. One list conversion per tensor instead of one per
+        # detection
+        height, width = page_image.dimensions
+        boxes = results["boxes"].round().to(torch.int32).numpy()
+        np.clip(boxes[:, 0::2], 0, width, out=boxes[:, 0::2])
+        np.clip(boxes[:, 1::2], 0, height, out=boxes[:, 1::2])
+        keep = (boxes[:, 2] > boxes[:, 0]) & (boxes[:, 3] > boxes[:, 1])
+        scores = results["scores"].numpy()[keep].tolist()
+        boxes = boxes[keep].tolist()
+
+        # Convert to domain objects
+        page_number = page_image.page_number
+        source_file = page_image.source_file
+        return [
+            DetectedTable(
+                detection_box=BoundingBox._trusted(x_min, y_min, x_max, y_max),
+                confidence_score=score,
+                page_number=page_number,
+                source_file=source_file
+            )
+            for score, (x_min, y_min, x_max, y_max) in zip(scores, boxes)
+        ]
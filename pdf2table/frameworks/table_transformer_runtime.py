@@ -0,0 +1,216 @@
+"""
+Model runtime shared by the Table Transformer adapters.
+
+Table detection and structure recognition run the same architecture, so the
+backend setup (ONNX, TorchScript, FP16, int8 quantization, bf16 autocast,
+torch.compile), the preprocessing and the CUDA stream handling live here,
+in a base class of both adapters.
+"""
+
+import contextlib
+import os
+from typing import Optional
+
+import numpy as np
+import torch
+from transformers import DetrFeatureExtractor, TableTransformerForObjectDetection
+
+from pdf2table.frameworks.image_preprocessing import TensorImagePreprocessor
+from pdf2table.frameworks.onnx_runtime import OnnxTableTransformer
+from pdf2table.frameworks.torchscript_runtime import TorchScriptTableTransformer
+from pdf2table.frameworks.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TableTransformerRuntime:
+    """Base class running a Table Transformer model on the configured backend."""
+
+    def _init_runtime(
+        self,
+        model: TableTransformerForObjectDetection,
+        feature_extractor: DetrFeatureExtractor,
+        device: str,
+        half_precision: bool,
+        quantize: bool,
+        onnx_path: Optional[str],
+        torchscript_path: Optional[str],
+        compile_model: bool,
+        bf16_autocast: bool,
+        preprocess_size: Optional[dict] = None,
+    ):
+        """
+        Set up ``model`` for inference.
+
+        Args:
+            model: The loaded Hugging Face model
+            feature_extractor: The model's feature extractor, whose settings
+                the preprocessing reproduces
+            device: Device the model runs on
+            half_precision: FP16 weights on CUDA
+            quantize: int8 weights on CPU (or in the exported ONNX graph)
+            onnx_path: Run with onnxruntime from this file, exported on first
+                use
+            torchscript_path: Run the traced model from this file, traced on
+                first use; ignored when onnx_path is set
+            compile_model: torch.compile the eager model
+            bf16_autocast: Run the FP32 eager model under bf16 autocast
+            preprocess_size: Resize settings overriding the feature
+                extractor's
+        """
+        self.model = model
+        self.device = device
+
+        self.model.to(self.device)
+        self.model.eval()
+        # Each model runs on its own CUDA stream, so detection of the next
+        # page (prefetched in another thread) overlaps structure recognition
+        # on the GPU instead of queuing behind it on the default stream
+        self._stream = (
+            torch.cuda.Stream(device=self.device)
+            if self.device.startswith("cuda")
+            else None
+        )
+        # NHWC weights (and inputs, see _to_device) select the faster
+        # convolution kernels of the CNN backbone
+        self.model.to(memory_format=torch.channels_last)
+
+        # An ONNX model path runs inference with onnxruntime instead (with
+        # quantize, the exported weights are int8). Otherwise FP16 weights on
+        # GPU run on tensor cores, post-processing staying FP32, and on CPU
+        # int8 dynamic quantization speeds up the transformer's Linear layers
+        # (the convolutional backbone stays FP32)
+        self.dtype = torch.float32
+        self.onnx_model = None
+        if onnx_path is not None:
+            # Export on first use; later runs load the saved graph
+            if not os.path.exists(onnx_path):
+                OnnxTableTransformer.export(self.model, onnx_path, quantize=quantize)
+            self.onnx_model = OnnxTableTransformer(
+                onnx_path, half_precision=half_precision
+            )
+        elif half_precision and self.device.startswith("cuda"):
+            self.model.half()
+            self.dtype = torch.float16
+        elif quantize and self.device == "cpu":
+            self.model = torch.ao.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+
+        # A TorchScript path traces the model as configured above (device,
+        # FP16 or quantization) on first use and runs the frozen graph
+        self.scripted_model = None
+        if torchscript_path is not None and self.onnx_model is None:
+            if not os.path.exists(torchscript_path):
+                TorchScriptTableTransformer.export(self.model, torchscript_path)
+            self.scripted_model = TorchScriptTableTransformer(
+                torchscript_path, device=self.device
+            )
+        eager = self.onnx_model is None and self.scripted_model is None
+
+        # Images are preprocessed with torch operations rather than through
+        # the feature extractor, on the model device (onnxruntime takes host
+        # tensors)
+        self._preprocess = TensorImagePreprocessor(
+            feature_extractor,
+            size=preprocess_size,
+            device=self.device if self.onnx_model is None else "cpu",
+        )
+
+        # bf16 autocast runs the FP32 model's matmuls and convolutions in bf16
+        # (CPUs with AVX-512-BF16/AMX, Ampere+ GPUs); FP16 or quantized models
+        # are left as they are
+        self.autocast_dtype = None
+        if bf16_autocast and eager and self.dtype == torch.float32:
+            self.autocast_dtype = torch.bfloat16
+
+        if compile_model and eager:
+            self._compile_model()
+
+    def _run_model(self, images):
+        """Preprocess images and run one forward pass, with host outputs.
+
+        Preprocessing and inference run on this model's CUDA stream (if
+        any), including the copy of the outputs back to the host. The raw
+        outputs are tiny (one row per query), so post-processing never
+        synchronizes with the device again.
+        """
+        with self._stream_context():
+            # Images of different sizes are padded to a common shape and the
+            # pixel mask hides the padding from the model
+            outputs = self._forward(self._preprocess(images))
+            outputs.logits = outputs.logits.float().cpu()
+            outputs.pred_boxes = outputs.pred_boxes.float().cpu()
+        return outputs
+
+    def _forward(self, encoding):
+        """Run the model on the encoded inputs, via onnxruntime or TorchScript if
+        configured."""
+        if self.onnx_model is not None:
+            return self.onnx_model(**encoding)
+        if self.scripted_model is not None:
+            with torch.inference_mode():
+                return self.scripted_model(**self._to_device(encoding))
+        # inference_mode also skips autograd's version counter and view
+        # tracking, which no_grad still pays for
+        device_type = "cuda" if self.device.startswith("cuda") else "cpu"
+        with torch.inference_mode(), torch.autocast(
+            device_type,
+            dtype=self.autocast_dtype,
+            enabled=self.autocast_dtype is not None
+        ):
+            return self.model(**self._to_device(encoding))
+
+    def _stream_context(self):
+        """Make this model's CUDA stream current; a no-op on CPU."""
+        if self._stream is None:
+            return contextlib.nullcontext()
+        # Order after work queued on the default stream, such as the weight
+        # conversions at load time (a GPU-side wait, no host sync)
+        self._stream.wait_stream(torch.cuda.default_stream(self.device))
+        return torch.cuda.stream(self._stream)
+
+    def _compile_model(self):
+        """Compile the model with torch.compile and warm it up.
+
+        Falls back to eager execution if compilation is unsupported.
+        """
+        try:
+            # Page and table images vary in size, so the graph is dynamic
+            # rather than specialized (or CUDA-graphed) per input shape
+            self.model = torch.compile(self.model, dynamic=True)
+            dummy = np.full((800, 800, 3), 255, dtype=np.uint8)
+            self._forward(self._preprocess([dummy]))
+        except Exception as e:
+            logger.warning("torch.compile unavailable, using eager model: %s", e)
+            self.model = getattr(self.model, "_orig_mod", self.model)
+
+    def _to_device(self, encoding) -> dict:
+        """Move the encoded inputs to the model device and dtype.
+
+        On CUDA, host tensors are staged in pinned memory and copied
+        asynchronously.
+        """
+        on_cuda = self.device.startswith("cuda")
+        moved = {}
+        for k, v in encoding.items():
+            if on_cuda and v.device.type == "cpu":
+                v = v.pin_memory()
+            dtype = self.dtype if v.is_floating_point() else None
+            memory_format = (
+                torch.channels_last if v.dim() == 4 else torch.preserve_format
+            )
+            moved[k] = v.to(
+                self.device,
+                dtype=dtype,
+                non_blocking=on_cuda,
+                memory_format=memory_format,
+            )
+        return moved
+
+    def set_confidence_threshold(self, threshold: float):
+        """Update confidence threshold."""
+        if not 0 <= threshold <= 1:
+            raise ValueError("Confidence threshold must be between 0 and 1")
+        self.confidence_threshold = threshold
@@ -0,0 +1,63 @@
+"""
+TorchScript execution of Table Transformer models.
+
+The model is traced once, frozen and saved. The loaded module runs without
+the Python dispatch of the Hugging Face model and, after
+``optimize_for_inference``, with fused convolutions and batch norms.
+"""
+
+import os
+from types import SimpleNamespace
+
+import torch
+
+from pdf2table.frameworks.onnx_runtime import _DetrOutputsWrapper
+from pdf2table.frameworks.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class TorchScriptTableTransformer:
+    """Run a traced Table Transformer.
+
+    Calling the instance mirrors calling the PyTorch model: it accepts the
+    ``pixel_values``/``pixel_mask`` inputs (already on the model's device)
+    and returns an object with ``logits`` and ``pred_boxes`` tensors.
+    """
+
+    def __init__(self, torchscript_path: str, device: str = "cpu"):
+        module = torch.jit.load(torchscript_path, map_location=device)
+        self.module = torch.jit.optimize_for_inference(module)
+        logger.info("Loaded TorchScript model %s on %s", torchscript_path, device)
+
+    def __call__(self, pixel_values: torch.Tensor, pixel_mask: torch.Tensor):
+        logits, pred_boxes = self.module(pixel_values, pixel_mask)
+        return SimpleNamespace(logits=logits, pred_boxes=pred_boxes)
+
+    @staticmethod
+    def export(model: torch.nn.Module, torchscript_path: str) -> str:
+        """Trace and freeze ``model`` into ``torchscript_path``.
+
+        The trace is shape-generic (sizes are recorded as operations, as for
+        the ONNX export), but it is specific to the model's device and dtype.
+        """
+        directory = os.path.dirname(torchscript_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # The wrapper is a fresh module and would otherwise be traced in
+        # training mode (dropout enabled)
+        wrapper = _DetrOutputsWrapper(model).eval()
+        parameter = next(model.parameters())
+        pixel_values = torch.zeros(
+            1, 3, 800, 800, device=parameter.device, dtype=parameter.dtype
+        )
+        pixel_mask = torch.ones(1, 800, 800, dtype=torch.int64, device=parameter.device)
+
+        logger.info("Exporting TorchScript model to %s", torchscript_path)
+        with torch.no_grad():
+            traced = torch.jit.trace(wrapper, (pixel_values, pixel_mask), strict=False)
+            frozen = torch.jit.freeze(traced.eval())
+        torch.jit.save(frozen, torchscript_path)
+        return torchscript_path
@@ -1,6 +1,11 @@
 import json
 from typing import List
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
 from pdf2table.entities.table_entities import DetectedTable
 
 
@@ -31,15 +36,19 @@ class TableExtractionResponse:
         return {
             "success": True,
             "source_file": self.source_file,
-            "tables": [
-                {
-                    "metadata": table.metadata,
-                    "data": table.grid.to_row_format() if table.grid else [],
-                }
-                for table in self.tables
-            ],
+            "tables": self._tables_to_dicts(),
         }
 
+    def _tables_to_dicts(self):
+        """Serialize tables to their metadata/data dictionaries."""
+        return [
+            {
+                "metadata": table.metadata,
+                "data": table.grid.to_row_format() if table.grid else [],
+            }
+            for table in self.tables
+        ]
+
     def save_to_json(self, output_path: str):
         """
         Save the extracted tables to a JSON file.
@@ -47,14 +56,17 @@ class TableExtractionResponse:
         Args:
             output_path: Path where the JSON file will be saved
         """
-        result_dict = {
-            "tables": [
-                {
-                    "metadata": table.metadata,
-                    "data": table.grid.to_row_format() if table.grid else [],
-                }
-                for table in self.tables
-            ]
-        }
+        result_dict = {"tables": self._tables_to_dicts()}
+
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        result_dict,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                    )
+                )
+            return
+
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(result_dict, f, indent=2, ensure_ascii=False)
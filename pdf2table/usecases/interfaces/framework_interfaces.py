@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 import numpy as np
 
 from pdf2table.entities.table_entities import (
@@ -11,8 +11,21 @@ class PDFImageExtractorInterface(ABC):
     """Abstract interface for PDF image extraction."""
     
     @abstractmethod
-    def extract_page_image(self, pdf_path: str, page_number: int) -> PageImage:
-        """Extract image from PDF page."""
+    def extract_page_image(
+        self,
+        pdf_path: str,
+        page_number: int,
+        dpi: Optional[int] = None,
+        include_words: bool = True,
+        clip: Optional[Tuple[float, float, float, float]] = None,
+    ) -> PageImage:
+        """Extract image from PDF page, optionally overriding the render DPI.
+
+        With ``include_words=False`` the page's word boxes are not extracted
+        and ``PageImage.words`` is empty. ``clip`` is an (x0, y0, x1, y1)
+        region in fractions of the page size; only it needs to be rendered,
+        the image keeping the full page size.
+        """
         pass
 
     @abstractmethod
@@ -20,6 +33,10 @@ class PDFImageExtractorInterface(ABC):
         """Get total number of pages in PDF."""
         pass
 
+    def close(self):
+        """Release any resources held across calls (e.g. open documents)."""
+        pass
+
 class TableDetectorInterface(ABC):
     """Abstract interface for table detection."""
     
@@ -28,6 +45,16 @@ class TableDetectorInterface(ABC):
         """Detect tables in a page image."""
         pass
 
+    def detect_tables_batch(
+        self, page_images: List[PageImage]
+    ) -> List[List[DetectedTable]]:
+        """Detect tables in several page images.
+
+        Returns one list of tables per page, in order. Implementations can
+        override this to run all pages through the model at once.
+        """
+        return [self.detect_tables(page_image) for page_image in page_images]
+
 
 class TableStructureRecognizerInterface(ABC):
     """Abstract interface for table structure recognition."""
@@ -37,6 +64,19 @@ class TableStructureRecognizerInterface(ABC):
         """Recognize structure of a detected table."""
         pass
 
+    def recognize_structures_batch(
+        self, page_image: PageImage, table_boxes: List[BoundingBox]
+    ) -> List[List[DetectedCell]]:
+        """Recognize structure of several tables on the same page.
+
+        Returns one list of cells per box, in order. Implementations can
+        override this to run all tables through the model at once.
+        """
+        return [
+            self.recognize_structure(page_image, table_box)
+            for table_box in table_boxes
+        ]
+
 
 class OCRInterface(ABC):
     """Abstract interface for optical character recognition."""
@@ -44,4 +84,12 @@ class OCRInterface(ABC):
     @abstractmethod
     def extract_text(self, image_crop: np.ndarray) -> str:
         """Extract text from image crop."""
-        pass
\ No newline at end of file
+        pass
+
+    def extract_text_batch(self, image_crops: List[np.ndarray]) -> List[str]:
+        """Extract text from several image crops, one string per crop.
+
+        Implementations that can batch inference should override this; the
+        default runs ``extract_text`` per crop.
+        """
+        return [self.extract_text(crop) for crop in image_crops]
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+Compiled kernels for grid post-processing.
+
+Numba is optional: when it is not installed the NumPy implementations below,
+which have the same semantics, are used instead.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _assign_cells_np(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    row_bounds: np.ndarray,
+    col_bounds: np.ndarray,
+) -> np.ndarray:
+    # (N, n_rows) and (N, n_cols) strict interval overlap tests
+    row_hit = (boxes[:, 3:4] > row_bounds[:-1]) & (boxes[:, 1:2] < row_bounds[1:])
+    col_hit = (boxes[:, 2:3] > col_bounds[:-1]) & (boxes[:, 0:1] < col_bounds[1:])
+    mask = row_hit[:, :, None] & col_hit[:, None, :]
+
+    # argmax keeps the first of equally confident cells, like the loop kernel
+    masked_scores = np.where(mask, scores[:, None, None], -np.inf)
+    winners = masked_scores.argmax(axis=0).astype(np.int32)
+    winners[~mask.any(axis=0)] = -1
+    return winners
+
+
+def _cluster_sorted_np(coords: np.ndarray, threshold: float) -> np.ndarray:
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(coords) >= threshold) + 1))
+    counts = np.diff(np.append(starts, len(coords)))
+    return np.add.reduceat(coords, starts) / counts
+
+
+def _assign_cells_loop(boxes, scores, row_bounds, col_bounds):
+    n_rows = len(row_bounds) - 1
+    n_cols = len(col_bounds) - 1
+    winners = np.full((n_rows, n_cols), -1, dtype=np.int32)
+    for i in range(boxes.shape[0]):
+        x_min, y_min, x_max, y_max = boxes[i, 0], boxes[i, 1], boxes[i, 2], boxes[i, 3]
+        # The boundaries are sorted, so the slots a box overlaps form one
+        # contiguous run of rows and of columns: those ending after its start
+        # and starting before its end
+        r_lo = max(np.searchsorted(row_bounds, y_min, side="right") - 1, 0)
+        r_hi = min(np.searchsorted(row_bounds, y_max, side="left"), n_rows)
+        c_lo = max(np.searchsorted(col_bounds, x_min, side="right") - 1, 0)
+        c_hi = min(np.searchsorted(col_bounds, x_max, side="left"), n_cols)
+        for r in range(r_lo, r_hi):
+            for c in range(c_lo, c_hi):
+                current = winners[r, c]
+                if current == -1 or scores[i] > scores[current]:
+                    winners[r, c] = i
+    return winners
+
+
+def _cluster_sorted_loop(coords, threshold):
+    centers = np.empty(len(coords), dtype=np.float64)
+    n_clusters = 0
+    start = 0
+    total = coords[0]
+    for i in range(1, len(coords)):
+        if coords[i] - coords[i - 1] >= threshold:
+            centers[n_clusters] = total / (i - start)
+            n_clusters += 1
+            start = i
+            total = 0.0
+        total += coords[i]
+    centers[n_clusters] = total / (len(coords) - start)
+    return centers[: n_clusters + 1]
+
+
+if njit is not None:
+    # fastmath is left off so results match the NumPy path exactly. The
+    # kernels release the GIL, so the pipeline's prefetch thread (rendering
+    # and detecting the next page) keeps running while a grid is assembled
+    _assign_cells_impl = njit(cache=True, nogil=True)(_assign_cells_loop)
+    _cluster_sorted_impl = njit(cache=True, nogil=True)(_cluster_sorted_loop)
+else:
+    _assign_cells_impl = _assign_cells_np
+    _cluster_sorted_impl = _cluster_sorted_np
+
+
+def assign_cells(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    row_bounds: np.ndarray,
+    col_bounds: np.ndarray,
+) -> np.ndarray:
+    """
+    Pick the most confident overlapping cell for every grid slot.
+
+    Args:
+        boxes: (N, 4) int64 array of x_min, y_min, x_max, y_max
+        scores: (N,) float64 confidences
+        row_bounds: (n_rows + 1,) int64 row boundaries
+        col_bounds: (n_cols + 1,) int64 column boundaries
+
+    Returns:
+        (n_rows, n_cols) int32 array of cell indices, -1 for empty slots
+    """
+    return _assign_cells_impl(boxes, scores, row_bounds, col_bounds)
+
+
+def cluster_sorted_coords(coords: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Average runs of sorted coordinates whose consecutive gaps are below
+    ``threshold``. ``coords`` must be a non-empty float64 array.
+    """
+    return _cluster_sorted_impl(coords, float(threshold))
@@ -1,6 +1,9 @@
-from typing import List
+from typing import List, Union
+
+import numpy as np
 
 from pdf2table.entities.table_entities import DetectedCell, TableGrid
+from pdf2table.usecases.services._grid_numba import cluster_sorted_coords
 
 
 class TableValidationService:
@@ -12,12 +15,11 @@ class TableValidationService:
         if len(cells) < 2:
             return False
 
-        # Simple validation: check if we have structure indicators or enough cells
-        has_structure = any(
-            "row" in cell.cell_type.lower() or "column" in cell.cell_type.lower()
-            for cell in cells
-        )
-        return has_structure or len(cells) >= 4
+        # Simple validation: enough cells, or a structure indicator (only
+        # scanned for when the cell count alone doesn't decide)
+        if len(cells) >= 4:
+            return True
+        return any(cell.is_structural for cell in cells)
 
     @staticmethod
     def calculate_grid_confidence(grid: TableGrid) -> float:
@@ -34,42 +36,28 @@ class CoordinateClusteringService:
 
     @staticmethod
     def cluster_coordinates(
-        coords: List[float], threshold: float = 20.0
+        coords: Union[List[float], np.ndarray], threshold: float = 20.0
     ) -> List[float]:
         """Cluster coordinates that are close together."""
-        if not coords:
+        if len(coords) == 0:
             return []
 
-        coords = sorted(set(coords))
+        # Sorted, de-duplicated coordinates in one C-level pass
+        coords = np.unique(np.asarray(coords, dtype=np.float64))
 
         if len(coords) > 2:
-            differences = [coords[i+1] - coords[i] for i in range(len(coords)-1)]
-            if differences:
-
-                mean_diff = sum(differences) / len(differences)
-
-                # Adjusting threshold for too high or low mean_diffs
-                threshold = max(threshold, mean_diff * 0.7)
-                if mean_diff < 5:
-                    threshold = min(threshold, mean_diff * 2)
-
-        clusters = [[coords[0]]]
-
-        for coord in coords[1:]:
-            if coord - clusters[-1][-1] < threshold:
-                clusters[-1].append(coord)
-            else:
-                clusters.append([coord])
+            mean_diff = float(np.diff(coords).mean())
 
-        cluster_centers = [sum(cluster) / len(cluster) for cluster in clusters]
+            # Adjusting threshold for too high or low mean_diffs: raise it to
+            # 0.7 * mean_diff, and cap it at 2 * mean_diff for dense edges
+            upper = mean_diff * 2 if mean_diff < 5 else float("inf")
+            threshold = min(max(threshold, mean_diff * 0.7), upper)
 
-        if len(cluster_centers) > 1:
-            final_centers = [cluster_centers[0]]
-            for center in cluster_centers[1:]:
+        # A new cluster starts wherever the gap to the previous coordinate
+        # reaches the threshold
+        cluster_centers = cluster_sorted_coords(coords, threshold)
 
-                if center - final_centers[-1] < threshold/2:
-                    continue
-                final_centers.append(center)
-            return final_centers
-            
-        return cluster_centers
\ No newline at end of file
+        # Consecutive centers are always at least `threshold` apart (each
+        # center lies within its cluster and clusters are split on gaps
+        # >= threshold), so no further merging at threshold / 2 is needed
+        return cluster_centers.tolist()
@@ -1,8 +1,21 @@
-from typing import List, Optional
+import copy
+import hashlib
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pdf2table.entities.table_entities import (
     PageImage,
     DetectedTable,
+    DetectedCell,
+    BoundingBox,
 )
 from pdf2table.usecases.dtos import TableExtractionResponse
 from pdf2table.usecases.services.table_services import (
@@ -22,6 +35,54 @@ from pdf2table.usecases.table_visualization_utils import (
 )
 
 
+# Detections covering less of the page than this are too small to hold a
+# table grid and skip structure recognition
+_MIN_TABLE_AREA_FRACTION = 0.001
+
+# Marks the end of the page stream between extract_pipeline stages
+_END_OF_PAGES = object()
+
+
+def _put_unless_stopped(q: queue.Queue, item, stop: threading.Event) -> bool:
+    """Put ``item`` on ``q``, giving up (returning False) once ``stop`` is set."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get_unless_stopped(q: queue.Queue, stop: threading.Event):
+    """Get an item from ``q``, or None once ``stop`` is set."""
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
+
+
+# Per-process use case, built once by the worker pool initializer
+_worker_use_case: Optional["TableExtractionUseCase"] = None
+
+
+def _init_page_worker(worker_factory: Callable[[], "TableExtractionUseCase"]):
+    """Pool initializer: build this process's own use case and adapters."""
+    global _worker_use_case
+    _worker_use_case = worker_factory()
+
+
+def _extract_page_in_worker(task: tuple):
+    pdf_path, page_number = task
+    try:
+        tables = _worker_use_case._extract_tables_from_page(pdf_path, page_number)
+        return page_number, tables, None
+    except Exception as e:
+        return page_number, [], str(e)
+
+
 class TableExtractionUseCase:
     """Use case for extracting tables from PDF documents."""
 
@@ -33,14 +94,58 @@ class TableExtractionUseCase:
         ocr_service: OCRInterface,
         visualize: bool = False,
         visualization_save_dir: str = None,
+        prefetch_pages: bool = True,
+        prefetch_detection: bool = False,
+        detection_dpi: Optional[int] = None,
+        detection_batch_size: int = 1,
+        num_workers: int = 1,
+        worker_factory: Optional[Callable[[], "TableExtractionUseCase"]] = None,
+        page_cache_size: int = 0,
+        ocr_cache_size: int = 0,
+        page_cache_dir: Optional[str] = None,
+        page_cache_tag: str = "",
     ):
         self.pdf_extractor = pdf_extractor
         self.table_detector = table_detector
         self.structure_recognizer = structure_recognizer
         self.validation_service = TableValidationService()
-        self.grid_builder = TableGridBuilder(ocr_service)
+        self.grid_builder = TableGridBuilder(
+            ocr_service, ocr_cache_size=ocr_cache_size
+        )
         self._visualize = visualize
         self._visualization_save_dir = visualization_save_dir
+        self._prefetch_pages = prefetch_pages
+        # Also run table detection on the prefetched page, so detection of
+        # the next page overlaps structure recognition of the current one.
+        # Worth it when the models run on an accelerator; on CPU both stages
+        # compete for the same cores
+        self._prefetch_detection = prefetch_detection
+        # When set, detection runs on a page rendered at this DPI and the
+        # full-resolution page is only rendered if a table was found
+        self._detection_dpi = detection_dpi
+        # Pages per table detection batch when extracting a whole document
+        self._detection_batch_size = max(1, detection_batch_size)
+        # Model adapters can't be shared across processes, so each worker
+        # calls the (picklable) factory once to build its own use case
+        self._num_workers = num_workers
+        self._worker_factory = worker_factory
+        # (pdf_path, mtime, page_number) -> tables, least recently used
+        # first. 0 disables result caching
+        self._page_cache_size = page_cache_size
+        self._page_cache: "OrderedDict[tuple, List[DetectedTable]]" = OrderedDict()
+        # Directory of pickled page results kept across runs, keyed by the
+        # PDF's content and page_cache_tag, which must identify the settings
+        # the results depend on (models, thresholds, DPI, ...). None disables
+        # it. Only point it at a trusted directory: entries are unpickled
+        self._page_cache_dir = page_cache_dir
+        self._page_cache_tag = page_cache_tag
+        # (pdf_path, mtime, size) -> content digest, so each file is hashed
+        # once per modification
+        self._file_digests: Dict[tuple, str] = {}
+        # extract_pipeline's render thread looks pages up while the consumer
+        # thread stores (and evicts) them; the lock guards both dicts. Entries
+        # are never modified once stored, so they are copied outside of it
+        self._page_cache_lock = threading.Lock()
 
     def extract_tables(
         self, pdf_path: str, page_number: Optional[int] = None
@@ -60,28 +165,523 @@ class TableExtractionUseCase:
                 tables = self._extract_tables_from_page(pdf_path, page_number)
                 return TableExtractionResponse(tables, pdf_path)
 
-            page_count = self.pdf_extractor.get_page_count(pdf_path)
-            all_tables = []
+            try:
+                page_count = self.pdf_extractor.get_page_count(pdf_path)
+                all_tables = self._extract_pages(pdf_path, range(page_count))
+            finally:
+                # Whole-document job is done, drop the cached document handle
+                self.pdf_extractor.close()
 
-            for page_num in range(page_count):
+            return TableExtractionResponse(all_tables, pdf_path)
+        except Exception as e:
+            return TableExtractionResponse.error(str(e), pdf_path)
+
+    def extract_tables_from_pages(
+        self, pdf_path: str, page_numbers: List[int]
+    ) -> TableExtractionResponse:
+        """
+        Extract tables from selected pages of a PDF document.
+
+        The pages take the same path as a whole document in extract_tables
+        (batched detection, prefetching, worker processes, page cache),
+        rather than one extract_tables call per page.
+
+        Args:
+            pdf_path: Path to the PDF file
+            page_numbers: Page numbers to extract; duplicates are ignored
+
+        Returns:
+            TableExtractionResponse with tables ordered by page number
+        """
+        try:
+            try:
+                all_tables = self._extract_pages(
+                    pdf_path, sorted(set(page_numbers))
+                )
+            finally:
+                self.pdf_extractor.close()
+
+            return TableExtractionResponse(all_tables, pdf_path)
+        except Exception as e:
+            return TableExtractionResponse.error(str(e), pdf_path)
+
+    def _extract_pages(
+        self, pdf_path: str, page_numbers: Iterable[int]
+    ) -> List[DetectedTable]:
+        """Extract tables from several pages, ordered by page number.
+
+        Pages that fail are reported and skipped.
+        """
+        page_tables = {}
+        pending_pages = []
+        for page_num in page_numbers:
+            cached = self._get_cached_page(pdf_path, page_num)
+            if cached is not None:
+                page_tables[page_num] = cached
+            else:
+                pending_pages.append(page_num)
+
+        if (
+            self._num_workers > 1
+            and self._worker_factory is not None
+            and pending_pages
+        ):
+            extracted = self._extract_pages_in_processes(pdf_path, pending_pages)
+        else:
+            extracted = {}
+            for page_num, load_page in self._iter_page_loaders(
+                pdf_path, pending_pages
+            ):
                 try:
-                    tables = self._extract_tables_from_page(pdf_path, page_num)
-                    all_tables.extend(tables)
+                    extracted[page_num] = self._extract_tables_from_page_image(
+                        *load_page()
+                    )
                 except Exception as e:
                     print(f"Error processing page {page_num}: {e}")
                     continue
 
-            return TableExtractionResponse(all_tables, pdf_path)
+        for page_num, tables in extracted.items():
+            self._cache_page(pdf_path, page_num, tables)
+        page_tables.update(extracted)
+
+        return [
+            table
+            for page_num in sorted(page_tables)
+            for table in page_tables[page_num]
+        ]
+
+    def extract_pipeline(
+        self, pdf_path: str, max_batch_wait: float = 0.05
+    ) -> Iterator[Tuple[int, List[DetectedTable]]]:
+        """
+        Extract tables from all pages, yielding (page_number, tables) for
+        each page, in page order, as soon as it is done.
+
+        Pages flow through three concurrent stages: rendering and table
+        detection each run in a background thread, structure recognition
+        and grid building in the caller's thread. The detection stage runs
+        up to detection_batch_size queued pages at once, or whatever arrived
+        within max_batch_wait seconds of the first one. Pages that fail are
+        reported and skipped, as in extract_tables.
+
+        Args:
+            pdf_path: Path to the PDF file
+            max_batch_wait: Seconds the detection stage waits to fill a batch
+        """
+        page_count = self.pdf_extractor.get_page_count(pdf_path)
+        stop = threading.Event()
+        # Bounded, so rendering can't run arbitrarily far ahead of the models
+        capacity = 2 * self._detection_batch_size
+        rendered = queue.Queue(maxsize=capacity)
+        detected = queue.Queue(maxsize=capacity)
+        stages = [
+            threading.Thread(
+                target=self._render_stage,
+                args=(pdf_path, page_count, rendered, stop),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._detect_stage,
+                args=(rendered, detected, max_batch_wait, stop),
+                daemon=True,
+            ),
+        ]
+        for stage in stages:
+            stage.start()
+
+        try:
+            while True:
+                item = detected.get()
+                if item is _END_OF_PAGES:
+                    break
+                page_num, loaded, tables = item
+                if tables is None:
+                    try:
+                        if isinstance(loaded, Exception):
+                            raise loaded
+                        tables = self._extract_tables_from_page_image(*loaded)
+                    except Exception as e:
+                        print(f"Error processing page {page_num}: {e}")
+                        continue
+                    self._cache_page(pdf_path, page_num, tables)
+                yield page_num, tables
+        finally:
+            # Also reached when the caller stops iterating early
+            stop.set()
+            for stage in stages:
+                stage.join()
+            self.pdf_extractor.close()
+
+    def _render_stage(
+        self,
+        pdf_path: str,
+        page_count: int,
+        rendered: queue.Queue,
+        stop: threading.Event,
+    ):
+        """Pipeline stage 1: queue (page_number, loaded, cached tables) items.
+
+        ``loaded`` is the (PageImage, None) pair or the exception raised while
+        rendering; pages found in the page cache are passed on unrendered.
+        """
+        try:
+            for page_num in range(page_count):
+                loaded, cached = None, None
+                try:
+                    cached = self._get_cached_page(pdf_path, page_num)
+                    if cached is None:
+                        loaded = (self._render_page(pdf_path, page_num), None)
+                except Exception as e:
+                    loaded = e
+                if not _put_unless_stopped(rendered, (page_num, loaded, cached), stop):
+                    return
+        finally:
+            _put_unless_stopped(rendered, _END_OF_PAGES, stop)
+
+    def _detect_stage(
+        self,
+        rendered: queue.Queue,
+        detected: queue.Queue,
+        max_batch_wait: float,
+        stop: threading.Event,
+    ):
+        """Pipeline stage 2: detect tables on mini-batches of rendered pages."""
+        try:
+            finished = False
+            while not finished:
+                item = _get_unless_stopped(rendered, stop)
+                if item is None:
+                    return
+                batch = []
+                deadline = time.monotonic() + max_batch_wait
+                while True:
+                    if item is _END_OF_PAGES:
+                        finished = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self._detection_batch_size:
+                        break
+                    try:
+                        item = rendered.get(
+                            timeout=max(0.0, deadline - time.monotonic())
+                        )
+                    except queue.Empty:
+                        break
+
+                pending = [
+                    idx for idx, (_, _, cached) in enumerate(batch) if cached is None
+                ]
+                loaded = self._detect_loaded_pages([batch[idx][1] for idx in pending])
+                for idx, page_loaded in zip(pending, loaded):
+                    batch[idx] = (batch[idx][0], page_loaded, None)
+                for page_item in batch:
+                    if not _put_unless_stopped(detected, page_item, stop):
+                        return
+        finally:
+            _put_unless_stopped(detected, _END_OF_PAGES, stop)
+
+    def _page_cache_key(self, pdf_path: str, page_number: int) -> tuple:
+        # The file's mtime invalidates entries when the PDF is rewritten
+        return (pdf_path, os.path.getmtime(pdf_path), page_number)
+
+    def _get_cached_page(
+        self, pdf_path: str, page_number: int
+    ) -> Optional[List[DetectedTable]]:
+        """Return a copy of the cached tables for a page, or None on a miss."""
+        if self._page_cache_size:
+            key = self._page_cache_key(pdf_path, page_number)
+            with self._page_cache_lock:
+                tables = self._page_cache.get(key)
+                if tables is not None:
+                    self._page_cache.move_to_end(key)
+            if tables is not None:
+                return copy.deepcopy(tables)
+
+        tables = self._load_disk_cached_page(pdf_path, page_number)
+        if tables is not None:
+            self._cache_page_in_memory(pdf_path, page_number, tables)
+        return tables
+
+    def _cache_page(
+        self, pdf_path: str, page_number: int, tables: List[DetectedTable]
+    ):
+        self._cache_page_in_memory(pdf_path, page_number, tables)
+        self._store_disk_cached_page(pdf_path, page_number, tables)
+
+    def _cache_page_in_memory(
+        self, pdf_path: str, page_number: int, tables: List[DetectedTable]
+    ):
+        if not self._page_cache_size:
+            return
+        key = self._page_cache_key(pdf_path, page_number)
+        tables = copy.deepcopy(tables)
+        with self._page_cache_lock:
+            self._page_cache[key] = tables
+            while len(self._page_cache) > self._page_cache_size:
+                self._page_cache.popitem(last=False)
+
+    def _disk_cache_path(self, pdf_path: str, page_number: int) -> str:
+        stat = os.stat(pdf_path)
+        file_key = (pdf_path, stat.st_mtime_ns, stat.st_size)
+        with self._page_cache_lock:
+            digest = self._file_digests.get(file_key)
+        if digest is None:
+            # Keyed by content rather than path, so copies and renames of a
+            # document share entries. Hashed outside the lock: two threads
+            # hashing the same file at once store the same digest
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(pdf_path, "rb") as f:
+                for chunk in iter(partial(f.read, 1 << 20), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            with self._page_cache_lock:
+                self._file_digests[file_key] = digest
+        tag = f"-{self._page_cache_tag}" if self._page_cache_tag else ""
+        return os.path.join(
+            self._page_cache_dir, f"{digest}{tag}-p{page_number}.pkl"
+        )
+
+    def _load_disk_cached_page(
+        self, pdf_path: str, page_number: int
+    ) -> Optional[List[DetectedTable]]:
+        if self._page_cache_dir is None:
+            return None
+        try:
+            with open(self._disk_cache_path(pdf_path, page_number), "rb") as f:
+                tables = pickle.load(f)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            return TableExtractionResponse.error(str(e), pdf_path)
+            # Unreadable or stale entries are recomputed and overwritten
+            print(f"Ignoring page cache entry for page {page_number}: {e}")
+            return None
+        # Results are shared between copies of a document
+        for table in tables:
+            table.source_file = pdf_path
+        return tables
+
+    def _store_disk_cached_page(
+        self, pdf_path: str, page_number: int, tables: List[DetectedTable]
+    ):
+        if self._page_cache_dir is None:
+            return
+        try:
+            os.makedirs(self._page_cache_dir, exist_ok=True)
+            path = self._disk_cache_path(pdf_path, page_number)
+            # Written next to the entry and renamed into place, so concurrent
+            # readers never see a partial file
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                pickle.dump(tables, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Could not write page cache entry for page {page_number}: {e}")
+
+    def _extract_pages_in_processes(
+        self, pdf_path: str, page_numbers: List[int]
+    ) -> Dict[int, List[DetectedTable]]:
+        """Extract pages in a pool of worker processes, keyed by page number."""
+        tasks = [(pdf_path, page_number) for page_number in page_numbers]
+        page_tables = {}
+
+        # spawn avoids forking a process that already holds model thread pools
+        with ProcessPoolExecutor(
+            max_workers=min(self._num_workers, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_page_worker,
+            initargs=(self._worker_factory,),
+        ) as executor:
+            for page_num, tables, error in executor.map(
+                _extract_page_in_worker, tasks
+            ):
+                if error is not None:
+                    print(f"Error processing page {page_num}: {error}")
+                    continue
+                page_tables[page_num] = tables
+
+        return page_tables
+
+    def _iter_page_loaders(self, pdf_path: str, page_numbers: List[int]):
+        """
+        Yield (page_number, loader) pairs where loader() returns the PageImage
+        and its detected tables (None if detection has not run yet).
+
+        Pages are loaded in chunks of detection_batch_size, each chunk's
+        tables being detected in one batch. With prefetching enabled, the
+        next chunk is rendered (and, with prefetch_detection, run through
+        table detection) in a background thread while the current one runs
+        through the remaining stages.
+        """
+        size = self._detection_batch_size
+        chunks = [
+            page_numbers[start:start + size]
+            for start in range(0, len(page_numbers), size)
+        ]
+        load = partial(self._load_pages, pdf_path)
+        if not self._prefetch_pages or len(chunks) <= 1:
+            for chunk in chunks:
+                # Loaded on the first page's loader() call, once per chunk
+                yield from self._chunk_loaders(
+                    chunk, lru_cache(maxsize=None)(partial(load, chunk))
+                )
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_chunk = executor.submit(load, chunks[0])
+            for idx, chunk in enumerate(chunks):
+                current_chunk = next_chunk
+                if idx + 1 < len(chunks):
+                    next_chunk = executor.submit(load, chunks[idx + 1])
+                yield from self._chunk_loaders(chunk, current_chunk.result)
+
+    def _chunk_loaders(self, page_numbers: List[int], get_loaded: Callable):
+        """Yield (page_number, loader) pairs over a chunk loaded by get_loaded."""
+        if len(page_numbers) > 1:
+            # Detection of a chunk that was not detected while prefetched runs
+            # here, in one batch, when its first page is requested
+            get_loaded = lru_cache(maxsize=None)(
+                lambda loaded=get_loaded: self._detect_loaded_pages(loaded())
+            )
+        for idx, page_num in enumerate(page_numbers):
+            yield page_num, partial(self._loaded_page, get_loaded, idx)
+
+    @staticmethod
+    def _loaded_page(
+        get_loaded: Callable, idx: int
+    ) -> Tuple[PageImage, Optional[List[DetectedTable]]]:
+        loaded = get_loaded()[idx]
+        if isinstance(loaded, Exception):
+            raise loaded
+        return loaded
+
+    def _load_pages(self, pdf_path: str, page_numbers: List[int]) -> list:
+        """Render pages, detecting their tables too if detection is prefetched.
+
+        Returns, per page, the (PageImage, detected tables or None) pair or
+        the exception raised while loading it.
+        """
+        loaded = []
+        for page_number in page_numbers:
+            try:
+                loaded.append((self._render_page(pdf_path, page_number), None))
+            except Exception as e:
+                loaded.append(e)
+        if self._prefetch_detection:
+            loaded = self._detect_loaded_pages(loaded)
+        return loaded
+
+    def _detect_loaded_pages(self, loaded: list) -> list:
+        """Detect tables on the rendered, not yet detected pages in one batch."""
+        pending = [
+            idx for idx, item in enumerate(loaded)
+            if not isinstance(item, Exception) and item[1] is None
+        ]
+        if not pending:
+            return loaded
+
+        page_images = [loaded[idx][0] for idx in pending]
+        try:
+            if len(page_images) == 1:
+                detections = [self.table_detector.detect_tables(page_images[0])]
+            else:
+                detections = self.table_detector.detect_tables_batch(page_images)
+        except Exception as e:
+            detections = [e] * len(page_images)
+
+        loaded = list(loaded)
+        for idx, page_image, tables in zip(pending, page_images, detections):
+            loaded[idx] = tables if isinstance(tables, Exception) else (page_image, tables)
+        return loaded
 
     def _extract_tables_from_page(
         self, pdf_path: str, page_number: int
     ) -> List[DetectedTable]:
         """Extract all tables from a PDF page."""
-        page_image = self.pdf_extractor.extract_page_image(pdf_path, page_number)
+        cached = self._get_cached_page(pdf_path, page_number)
+        if cached is not None:
+            return cached
+
+        page_image = self._render_page(pdf_path, page_number)
+        tables = self._extract_tables_from_page_image(page_image)
+        self._cache_page(pdf_path, page_number, tables)
+        return tables
+
+    def _render_page(self, pdf_path: str, page_number: int) -> PageImage:
+        """Render the page image used for table detection."""
+        if self._detection_dpi is None:
+            return self.pdf_extractor.extract_page_image(pdf_path, page_number)
+        # The detector only looks at pixels, and words are taken from the
+        # full-resolution render if a table is found
+        return self.pdf_extractor.extract_page_image(
+            pdf_path, page_number, dpi=self._detection_dpi, include_words=False
+        )
+
+    def _upscale_for_structure(
+        self, page_image: PageImage, detected_tables: List[DetectedTable]
+    ):
+        """Render the full-resolution page and map detection boxes onto it.
+
+        Only the region covering the detected tables is rasterized, unless
+        the whole page is needed for visualization.
+        """
+        clip = None
+        if not self._visualize:
+            boxes = [table.detection_box for table in detected_tables]
+            # A couple of pixels of slack for rounding at the higher DPI
+            margin = 2
+            clip = (
+                max(0, min(box.x_min for box in boxes) - margin) / page_image.width,
+                max(0, min(box.y_min for box in boxes) - margin) / page_image.height,
+                min(page_image.width, max(box.x_max for box in boxes) + margin)
+                / page_image.width,
+                min(page_image.height, max(box.y_max for box in boxes) + margin)
+                / page_image.height,
+            )
+        full_image = self.pdf_extractor.extract_page_image(
+            page_image.source_file, page_image.page_number, clip=clip
+        )
+        scale_x = full_image.width / page_image.width
+        scale_y = full_image.height / page_image.height
+
+        for table in detected_tables:
+            box = table.detection_box
+            x_min = min(int(round(box.x_min * scale_x)), full_image.width - 1)
+            y_min = min(int(round(box.y_min * scale_y)), full_image.height - 1)
+            table.detection_box = BoundingBox(
+                x_min=x_min,
+                y_min=y_min,
+                x_max=max(
+                    x_min + 1, min(int(round(box.x_max * scale_x)), full_image.width)
+                ),
+                y_max=max(
+                    y_min + 1, min(int(round(box.y_max * scale_y)), full_image.height)
+                ),
+            )
+
+        return full_image, detected_tables
+
+    def _extract_tables_from_page_image(
+        self,
+        page_image: PageImage,
+        detected_tables: Optional[List[DetectedTable]] = None,
+    ) -> List[DetectedTable]:
+        """Extract all tables from an already rendered page image.
 
-        detected_tables = self.table_detector.detect_tables(page_image)
+        ``detected_tables`` skips detection when it already ran on the page.
+        """
+        if detected_tables is None:
+            detected_tables = self.table_detector.detect_tables(page_image)
+
+        min_area = _MIN_TABLE_AREA_FRACTION * page_image.width * page_image.height
+        detected_tables = [
+            table for table in detected_tables
+            if table.detection_box.area >= min_area
+        ]
+
+        if detected_tables and self._detection_dpi is not None:
+            page_image, detected_tables = self._upscale_for_structure(
+                page_image, detected_tables
+            )
 
         if self._visualize:
             visualize_table_detection(
@@ -90,27 +690,62 @@ class TableExtractionUseCase:
                 visualization_save_dir=self._visualization_save_dir,
             )
 
+        cells_per_table = self._recognize_structures(page_image, detected_tables)
+
         structured_tables = []
-        for idx, table in enumerate(detected_tables):
+        for idx, (table, detected_cells) in enumerate(
+            zip(detected_tables, cells_per_table)
+        ):
             try:
                 structured_table = self._process_detected_table(
-                    page_image, table, table_idx=idx
+                    page_image, table, table_idx=idx, detected_cells=detected_cells
                 )
                 if structured_table:
                     structured_tables.append(structured_table)
             except Exception as e:
-                print(f"Error processing table on page {page_number}: {e}")
+                print(f"Error processing table on page {page_image.page_number}: {e}")
                 continue
 
         return structured_tables
 
+    def _recognize_structures(
+        self, page_image: PageImage, detected_tables: List[DetectedTable]
+    ) -> List[Optional[List[DetectedCell]]]:
+        """
+        Recognize the structure of all tables on a page in one batch.
+
+        Returns None for every table when there is nothing to batch or the
+        batch fails, in which case each table is recognized on its own so a
+        single bad table only drops itself.
+        """
+        if len(detected_tables) <= 1:
+            return [None] * len(detected_tables)
+
+        try:
+            cells_per_table = self.structure_recognizer.recognize_structures_batch(
+                page_image, [table.detection_box for table in detected_tables]
+            )
+        except Exception as e:
+            print(
+                f"Batched structure recognition failed on page "
+                f"{page_image.page_number}, retrying per table: {e}"
+            )
+            return [None] * len(detected_tables)
+
+        return list(cells_per_table)
+
     def _process_detected_table(
-        self, page_image: PageImage, detected_table: DetectedTable, table_idx: int = 0
+        self,
+        page_image: PageImage,
+        detected_table: DetectedTable,
+        table_idx: int = 0,
+        detected_cells: Optional[List[DetectedCell]] = None,
     ) -> Optional[DetectedTable]:
         """Process a single detected table to extract its structure."""
-        detected_cells = self.structure_recognizer.recognize_structure(
-            page_image, detected_table.detection_box
-        )
+        if detected_cells is None:
+            detected_cells = self.structure_recognizer.recognize_structure(
+                page_image, detected_table.detection_box
+            )
 
         if self._visualize:
             visualize_table_structure(
@@ -1,5 +1,7 @@
+import hashlib
+from collections import OrderedDict
 from typing import List, Optional
-import fitz
+import numpy as np
 
 from pdf2table.entities.table_entities import (
     PageImage,
@@ -11,6 +13,7 @@ from pdf2table.entities.table_entities import (
 from pdf2table.usecases.services.table_services import (
     CoordinateClusteringService,
 )
+from pdf2table.usecases.services._grid_numba import assign_cells
 from pdf2table.usecases.interfaces.framework_interfaces import (
     OCRInterface,
 )
@@ -19,9 +22,14 @@ from pdf2table.usecases.interfaces.framework_interfaces import (
 class TableGridBuilder:
     """Use case for building structured table grids from detected cells."""
 
-    def __init__(self, ocr_service: OCRInterface):
+    def __init__(self, ocr_service: OCRInterface, ocr_cache_size: int = 0):
         self._ocr_service = ocr_service
         self._clustering_service = CoordinateClusteringService()
+        # Crop content hash -> OCR text, least recently used first. Kept
+        # across tables and pages: headers, empty cells and repeated values
+        # produce identical crops. 0 disables caching
+        self._ocr_cache_size = ocr_cache_size
+        self._ocr_cache: "OrderedDict[bytes, str]" = OrderedDict()
 
     def build_grid(
         self,
@@ -33,235 +41,205 @@ class TableGridBuilder:
         if not detected_cells:
             return None
 
-        # Collect all y and x edges from all detected cells
-        y_edges = set()
-        x_edges = set()
-        for cell in detected_cells:
-            y_edges.add(cell.box.y_min)
-            y_edges.add(cell.box.y_max)
-            x_edges.add(cell.box.x_min)
-            x_edges.add(cell.box.x_max)
+        # Read the detections into (N, 4) boxes and (N,) scores once; edge
+        # clustering and slot assignment both work on these columns
+        boxes = np.array(
+            [cell.box.to_list() for cell in detected_cells], dtype=np.int64
+        )
+        scores = np.array(
+            [cell.confidence_score for cell in detected_cells], dtype=np.float64
+        )
 
-        # Cluster edges to get row/col boundaries
+        # Cluster all y and x edges to get row/col boundaries (the clustering
+        # service sorts and de-duplicates its input)
         row_boundaries = self._clustering_service.cluster_coordinates(
-            sorted(y_edges), threshold=10.0
+            boxes[:, [1, 3]].ravel(), threshold=10.0
         )
         col_boundaries = self._clustering_service.cluster_coordinates(
-            sorted(x_edges), threshold=10.0
+            boxes[:, [0, 2]].ravel(), threshold=10.0
         )
 
-        # Ensure sorted and unique
-        row_boundaries = sorted(set(int(round(y)) for y in row_boundaries))
-        col_boundaries = sorted(set(int(round(x)) for x in col_boundaries))
+        # Round to pixels, ensuring sorted and unique (np.rint rounds half to
+        # even, like round)
+        row_boundaries = np.unique(
+            np.rint(np.asarray(row_boundaries, dtype=np.float64)).astype(np.int64)
+        )
+        col_boundaries = np.unique(
+            np.rint(np.asarray(col_boundaries, dtype=np.float64)).astype(np.int64)
+        )
 
         n_rows = len(row_boundaries) - 1
         n_cols = len(col_boundaries) - 1
         if n_rows <= 0 or n_cols <= 0:
             return None
 
-        # Build grid: assign detected cells to grid slots by overlap
-        grid = {}
-        for cell in detected_cells:
-            c_xmin, c_ymin, c_xmax, c_ymax = (
-                cell.box.x_min,
-                cell.box.y_min,
-                cell.box.x_max,
-                cell.box.y_max,
-            )
-            for r in range(n_rows):
-                # Check if the cell vertically overlaps with the current grid row, skip if not
-                if not (c_ymax > row_boundaries[r] and c_ymin < row_boundaries[r + 1]):
-                    continue
-                for c in range(n_cols):
-                    # Check horizontal overlap
-                    if not (
-                        c_xmax > col_boundaries[c] and c_xmin < col_boundaries[c + 1]
-                    ):
-                        continue
-                    pos = (r, c)
-                    if (
-                        pos not in grid
-                        or cell.confidence_score > grid[pos].confidence_score
-                    ):
-                        grid[pos] = cell
+        # Assign detected cells to grid slots by overlap; each slot keeps the
+        # confidence of its most confident overlapping cell
+        confidences = self._assign_slot_confidences(
+            boxes, scores, row_boundaries, col_boundaries
+        )
+
+        # (start, end) spans of every row and column as Python ints, clamped
+        # to the page origin and the table's far edges once for all cells
+        row_bounds = np.clip(row_boundaries, 0, table_box.y_max).tolist()
+        col_bounds = np.clip(col_boundaries, 0, table_box.x_max).tolist()
+        row_spans = list(zip(row_bounds[:-1], row_bounds[1:]))
+        col_spans = list(zip(col_bounds[:-1], col_bounds[1:]))
 
         # Fill grid cells, including empty ones
         grid_cells = []
-        for r in range(n_rows):
-            for c in range(n_cols):
-                pos = (r, c)
-                # Compute cell bounding box
+        for r, (row_start, row_end) in enumerate(row_spans):
+            row_confidences = confidences[r]
+            for c, (col_start, col_end) in enumerate(col_spans):
                 cell_box = BoundingBox(
-                    x_min=max(0, col_boundaries[c]),
-                    y_min=max(0, row_boundaries[r]),
-                    x_max=min(table_box.x_max, col_boundaries[c + 1]),
-                    y_max=min(table_box.y_max, row_boundaries[r + 1]),
+                    x_min=col_start, y_min=row_start, x_max=col_end, y_max=row_end
                 )
-                if pos in grid:
-                    cell = grid[pos]
-                    confidence = cell.confidence_score
-                else:
-                    confidence = 0.0
-
-                text = ""
-                if cell_box.area > 0:
-                    text = self._extract_cell_text(cell_box, page_image)
 
                 grid_cell = GridCell(
                     row=r,
                     col=c,
-                    text=text,
+                    text="",
                     box=cell_box,
-                    confidence_score=confidence,
+                    confidence_score=row_confidences[c],
                 )
                 grid_cells.append(grid_cell)
 
-        return TableGrid(
-            cells=grid_cells, n_rows=n_rows, n_cols=n_cols, table_box=table_box
+        # Embedded PDF text of all non-empty cells at once. Cells without any
+        # are OCRed afterwards, all in one batch
+        text_cells = [cell for cell in grid_cells if cell.box.area > 0]
+        texts = self._extract_pdf_texts(
+            [cell.box for cell in text_cells], page_image
         )
+        ocr_crops = []
+        ocr_cells = []
+        for grid_cell, text in zip(text_cells, texts):
+            if text:
+                grid_cell.text = text
+            else:
+                crop = self._crop_cell(grid_cell.box, page_image)
+                if crop is not None:
+                    ocr_crops.append(crop)
+                    ocr_cells.append(grid_cell)
 
-    def _create_grid_cells(
-        self,
-        detected_cells: List[DetectedCell],
-        rows: List[float],
-        cols: List[float],
-        page_image: PageImage,
-        table_box: BoundingBox,
-    ) -> List[GridCell]:
-        """Create grid cells by mapping detected cells to grid positions."""
-        grid_cells = []
-
-        for row_idx, row_y in enumerate(rows):
-            for col_idx, col_x in enumerate(cols):
-                # Find the best matching detected cell for this grid position
-                best_cell = self._find_best_cell_for_position(
-                    detected_cells, row_y, col_x
-                )
-
-                # Calculate cell boundaries
-                cell_box = self._calculate_cell_boundaries(
-                    row_idx, col_idx, rows, cols, table_box
-                )
-
-                # Extract text
-                text = ""
-                confidence = 0.0
-                if best_cell:
-                    confidence = best_cell.confidence_score
-
-                if cell_box.area > 0:
-                    text = self._extract_cell_text(cell_box, page_image)
-
-                grid_cell = GridCell(
-                    row=row_idx,
-                    col=col_idx,
-                    text=text,
-                    box=cell_box,
-                    confidence_score=confidence,
-                )
-                grid_cells.append(grid_cell)
-
-        return grid_cells
-
-    def _find_best_cell_for_position(
-        self, detected_cells: List[DetectedCell], target_y: float, target_x: float
-    ) -> Optional[DetectedCell]:
-        """Find the detected cell closest to the target position."""
-        if not detected_cells:
-            return None
-
-        best_cell = None
-        min_distance = float("inf")
-
-        for cell in detected_cells:
-            distance = abs(cell.box.center_y - target_y) + abs(
-                cell.box.center_x - target_x
-            )
-            if distance < min_distance:
-                min_distance = distance
-                best_cell = cell
+        for grid_cell, text in zip(ocr_cells, self._ocr_crops(ocr_crops)):
+            grid_cell.text = text
 
-        return best_cell
+        return TableGrid(
+            cells=grid_cells, n_rows=n_rows, n_cols=n_cols, table_box=table_box
+        )
 
-    def _calculate_cell_boundaries(
+    def _assign_slot_confidences(
         self,
-        row_idx: int,
-        col_idx: int,
-        rows: List[float],
-        cols: List[float],
-        table_box: BoundingBox,
-    ) -> BoundingBox:
-        """Calculate cell boundaries based on grid position."""
-        # Simple boundary calculation using midpoints
-        if row_idx == 0:
-            y_min = table_box.y_min
-        else:
-            y_min = (
-                int((rows[row_idx - 1] + rows[row_idx]) / 2)
-                if row_idx > 0
-                else table_box.y_min
-            )
-
-        if row_idx == len(rows) - 1:
-            y_max = table_box.y_max
-        else:
-            y_max = (
-                int((rows[row_idx] + rows[row_idx + 1]) / 2)
-                if row_idx < len(rows) - 1
-                else table_box.y_max
-            )
-
-        if col_idx == 0:
-            x_min = table_box.x_min
-        else:
-            x_min = (
-                int((cols[col_idx - 1] + cols[col_idx]) / 2)
-                if col_idx > 0
-                else table_box.x_min
+        boxes: np.ndarray,
+        scores: np.ndarray,
+        row_boundaries: np.ndarray,
+        col_boundaries: np.ndarray,
+    ) -> List[List[float]]:
+        """
+        Return an (n_rows, n_cols) nested list with, per grid slot, the
+        confidence of the most confident detected cell overlapping it, or 0.0
+        if no cell overlaps it.
+        """
+        winners = assign_cells(boxes, scores, row_boundaries, col_boundaries)
+
+        confidences = np.where(winners >= 0, scores[winners], 0.0)
+        return confidences.tolist()
+
+    @staticmethod
+    def _extract_pdf_texts(
+        cell_boxes: List[BoundingBox], page_image: PageImage
+    ) -> List[str]:
+        """Join, per cell, the embedded PDF words intersecting it ("" if there
+        are none), with one (cells, words) intersection test."""
+        if not cell_boxes:
+            return []
+        try:
+            # Direct PDF text extraction from the page's word boxes
+            words = page_image.word_boxes
+            cells = np.array([box.to_list() for box in cell_boxes], dtype=np.float64)
+
+            # Only words reaching into the cells' extent take part
+            near = np.flatnonzero(
+                (words[:, 2] > cells[:, 0].min())
+                & (words[:, 0] < cells[:, 2].max())
+                & (words[:, 3] > cells[:, 1].min())
+                & (words[:, 1] < cells[:, 3].max())
+                # Empty word boxes intersect nothing, as for fitz.Rect
+                & (words[:, 0] < words[:, 2])
+                & (words[:, 1] < words[:, 3])
             )
-
-        if col_idx == len(cols) - 1:
-            x_max = table_box.x_max
-        else:
-            x_max = (
-                int((cols[col_idx] + cols[col_idx + 1]) / 2)
-                if col_idx < len(cols) - 1
-                else table_box.x_max
+            words = words[near]
+            word_texts = page_image.word_texts[near]
+
+            # Strict overlap tests, as fitz.Rect.intersects
+            hits = (
+                (words[:, 2] > cells[:, 0:1])
+                & (words[:, 0] < cells[:, 2:3])
+                & (words[:, 3] > cells[:, 1:2])
+                & (words[:, 1] < cells[:, 3:4])
             )
-
-        return BoundingBox(
-            x_min=max(0, x_min),
-            y_min=max(0, y_min),
-            x_max=min(table_box.x_max, x_max),
-            y_max=min(table_box.y_max, y_max),
-        )
-
-    def _extract_cell_text(self, cell_box: BoundingBox, page_image: PageImage) -> str:
-        """Extract text from cell using direct PDF extraction if possible, else OCR."""
-        try:
-            # Try direct PDF text extraction using PyMuPDF
+            return [" ".join(word_texts[hit]).strip() for hit in hits]
+        except Exception:
+            # Fallback to OCR if direct extraction fails
+            return [""] * len(cell_boxes)
+
+    @staticmethod
+    def _crop_cell(cell_box: BoundingBox, page_image: PageImage) -> Optional[np.ndarray]:
+        """Crop the cell from the page image, None if the crop is empty."""
+        crop = page_image.image_data[
+            cell_box.y_min : cell_box.y_max, cell_box.x_min : cell_box.x_max
+        ]
+        if crop.size > 0 and crop.shape[0] > 0 and crop.shape[1] > 0:
+            return crop
+        return None
+
+    def _ocr_crops(self, crops: List[np.ndarray]) -> List[str]:
+        """OCR cell crops in one batch; "" for every crop if OCR is unavailable.
+
+        Crops seen before (or repeated within the batch) are answered from
+        the OCR cache; only the distinct new ones are run through OCR.
+        """
+        if not crops or self._ocr_service is None:
+            return [""] * len(crops)
+        if not self._ocr_cache_size:
             try:
-                area = (cell_box.x_min, cell_box.y_min, cell_box.x_max, cell_box.y_max)
-                rect = fitz.Rect(area)
-                selected_text = " ".join(
-                    [
-                        w[4]
-                        for w in page_image.words
-                        if fitz.Rect(w[:4]).intersects(rect)
-                    ]
-                )
-                if selected_text.strip():
-                    return selected_text.strip()
+                return self._ocr_service.extract_text_batch(crops)
             except Exception:
-                pass  # Fallback to OCR if direct extraction fails
+                return [""] * len(crops)
+
+        keys = [self._crop_key(crop) for crop in crops]
+        texts = {}
+        pending = {}
+        for key, crop in zip(keys, crops):
+            if key in texts or key in pending:
+                continue
+            cached = self._ocr_cache.get(key)
+            if cached is not None:
+                self._ocr_cache.move_to_end(key)
+                texts[key] = cached
+            else:
+                pending[key] = crop
 
-            # Fallback: Crop image and use OCR
-            crop = page_image.image_data[
-                cell_box.y_min : cell_box.y_max, cell_box.x_min : cell_box.x_max
-            ]
-            if crop.size > 0 and crop.shape[0] > 0 and crop.shape[1] > 0:
-                return self._ocr_service.extract_text(crop)
+        if pending:
+            try:
+                results = self._ocr_service.extract_text_batch(list(pending.values()))
+            except Exception:
+                # Failures are not cached
+                results = None
+            if results is None:
+                texts.update(dict.fromkeys(pending, ""))
             else:
-                return ""
-        except Exception:
-            return ""
+                for key, text in zip(pending, results):
+                    texts[key] = text
+                    self._ocr_cache[key] = text
+                while len(self._ocr_cache) > self._ocr_cache_size:
+                    self._ocr_cache.popitem(last=False)
+
+        return [texts[key] for key in keys]
+
+    @staticmethod
+    def _crop_key(crop: np.ndarray) -> bytes:
+        """Content hash of a crop, its shape included."""
+        digest = hashlib.blake2b(str(crop.shape).encode(), digest_size=16)
+        digest.update(np.ascontiguousarray(crop).data)
+        return digest.digest()
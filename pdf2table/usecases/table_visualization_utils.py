@@ -1,7 +1,9 @@
+from functools import lru_cache
 from typing import Optional, List
 import os
 
-import matplotlib.pyplot as plt
+import numpy as np
+
 from pdf2table.entities.table_entities import (
     PageImage,
     TableGrid,
@@ -10,6 +12,100 @@ from pdf2table.entities.table_entities import (
 )
 
 
+COLORS = [
+    [0.000, 0.447, 0.741],  # Blue
+    [0.850, 0.325, 0.098],  # Red
+    [0.929, 0.694, 0.125],  # Yellow
+    [0.494, 0.184, 0.556],  # Purple
+    [0.466, 0.674, 0.188],  # Green
+    [0.301, 0.745, 0.933],  # Cyan
+]
+
+GRID_COLORS = COLORS + [
+    [0.635, 0.078, 0.184],  # Dark Red
+    [0.300, 0.300, 0.300],  # Gray
+    [0.800, 0.500, 0.300],  # Orange
+]
+
+
+def _rgba(color: List[float], alpha: float = 1.0) -> tuple:
+    """Convert a float RGB color to an 8-bit RGBA tuple."""
+    return tuple(round(v * 255) for v in color) + (round(alpha * 255),)
+
+
+@lru_cache(maxsize=16)
+def _font(size: int):
+    """A font at ``size`` pixels, loaded once per size.
+
+    DejaVu Sans covers the non-ASCII text of cells; PIL's bundled font, used
+    when it is not installed, only covers ASCII.
+    """
+    from PIL import ImageFont
+
+    try:
+        return ImageFont.truetype("DejaVuSans.ttf", size)
+    except OSError:
+        return ImageFont.load_default(size=size)
+
+
+def _save_annotated_image(
+    image: np.ndarray,
+    rects: List[tuple],
+    labels: List[tuple],
+    title: str,
+    save_path: str,
+    font_scale: float,
+):
+    """
+    Draw boxes and labels on an RGB image and save it with a title band.
+
+    Drawing goes straight to raster with PIL, which is much cheaper than
+    building and rendering a matplotlib figure per image.
+
+    Args:
+        image: HxWx3 RGB image
+        rects: (x_min, y_min, x_max, y_max, rgba, line_width) outlines
+        labels: (x, y, text, text_rgba, background_rgba, anchor) labels, with
+            a PIL text anchor such as "lb" (left, bottom) or "mm" (centered)
+        title: Title drawn above the image
+        save_path: Path of the PNG file
+        font_scale: Font size as a fraction of the image width
+    """
+    # PIL is only imported once something is actually drawn
+    from PIL import Image, ImageDraw
+
+    canvas = Image.fromarray(np.ascontiguousarray(image)).convert("RGBA")
+    width = canvas.size[0]
+    font = _font(max(10, round(width * font_scale)))
+    # Line widths are in points of a ~1000 pixel wide image
+    line_scale = max(1, round(width / 1000))
+
+    # Translucent outlines and label backgrounds go on an overlay that is
+    # composited onto the image once
+    overlay = Image.new("RGBA", canvas.size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
+    for x_min, y_min, x_max, y_max, color, line_width in rects:
+        draw.rectangle(
+            (x_min, y_min, x_max, y_max), outline=color, width=line_width * line_scale
+        )
+    pad = max(1, font.size // 5)
+    for x, y, text, text_color, background, anchor in labels:
+        left, top, right, bottom = draw.textbbox((x, y), text, font=font, anchor=anchor)
+        draw.rectangle((left - pad, top - pad, right + pad, bottom + pad), fill=background)
+        draw.text((x, y), text, font=font, fill=text_color, anchor=anchor)
+    canvas = Image.alpha_composite(canvas, overlay).convert("RGB")
+
+    band = font.size * 2
+    result = Image.new("RGB", (width, canvas.size[1] + band), "white")
+    result.paste(canvas, (0, band))
+    ImageDraw.Draw(result).text(
+        (width / 2, band / 2), title, font=font, fill="black", anchor="mm"
+    )
+    # Fast zlib level: the annotated images are debugging aids, encoding
+    # time matters more than file size
+    result.save(save_path, compress_level=1)
+
+
 def visualize_table_detection(
     page_image: PageImage,
     detected_tables: List[DetectedTable],
@@ -18,57 +114,30 @@ def visualize_table_detection(
     """
     Visualize DetectedTable entities on a PageImage.
     """
-    save_path = None
     os.makedirs(visualization_save_dir, exist_ok=True)
     save_path = os.path.join(
         visualization_save_dir, f"detection_page{page_image.page_number}.png"
     )
-    
-    COLORS = [
-        [0.000, 0.447, 0.741],
-        [0.850, 0.325, 0.098],
-        [0.929, 0.694, 0.125],
-        [0.494, 0.184, 0.556],
-        [0.466, 0.674, 0.188],
-        [0.301, 0.745, 0.933],
-    ]
-
-    plt.figure(figsize=(16, 10))
-    plt.imshow(page_image.image_data)
-    ax = plt.gca()
-    colors = COLORS * 100
 
+    rects, labels = [], []
     for i, table in enumerate(detected_tables):
-        c = colors[i % len(colors)]
+        c = COLORS[i % len(COLORS)]
         box = table.detection_box
         label = "table"
-        ax.add_patch(
-            plt.Rectangle(
-                (box.x_min, box.y_min),
-                box.x_max - box.x_min,
-                box.y_max - box.y_min,
-                fill=False,
-                color=c,
-                linewidth=3,
-            )
-        )
+        rects.append((box.x_min, box.y_min, box.x_max, box.y_max, _rgba(c), 3))
         text = f"{label}: {table.confidence_score:0.2f}"
-        ax.text(
-            box.x_min,
-            box.y_min,
-            text,
-            fontsize=15,
-            bbox=dict(facecolor="yellow", alpha=0.5),
+        labels.append(
+            (box.x_min, box.y_min, text, _rgba([0, 0, 0]), _rgba([1, 1, 0], 0.5), "lb")
         )
 
-    plt.axis("off")
-    plt.title("Table Detection Result")
-
-    if save_path:
-        plt.savefig(save_path, bbox_inches="tight")
-        plt.close()
-    else:
-        plt.show()
+    _save_annotated_image(
+        page_image.image_data,
+        rects,
+        labels,
+        "Table Detection Result",
+        save_path,
+        font_scale=1 / 75,
+    )
 
 
 def visualize_table_structure(
@@ -82,56 +151,35 @@ def visualize_table_structure(
         visualization_save_dir,
         f"structure_page{page_image.page_number}_table{page_image.page_number}.png",
     )
-    COLORS = [
-        [0.000, 0.447, 0.741],
-        [0.850, 0.325, 0.098],
-        [0.929, 0.694, 0.125],
-        [0.494, 0.184, 0.556],
-        [0.466, 0.674, 0.188],
-        [0.301, 0.745, 0.933],
-    ]
 
     # Crop the table image
     cropped = page_image.image_data[
         table_box.y_min : table_box.y_max, table_box.x_min : table_box.x_max
     ]
-    plt.figure(figsize=(12, 8))
-    plt.imshow(cropped)
-    ax = plt.gca()
-    colors = COLORS * 100
+
+    rects, labels = [], []
     for i, cell in enumerate(detected_cells):
-        c = colors[i % len(colors)]
+        c = COLORS[i % len(COLORS)]
         # Draw cell box relative to crop
         rel_xmin = cell.box.x_min - table_box.x_min
         rel_ymin = cell.box.y_min - table_box.y_min
         rel_xmax = cell.box.x_max - table_box.x_min
         rel_ymax = cell.box.y_max - table_box.y_min
         label = cell.cell_type
-        ax.add_patch(
-            plt.Rectangle(
-                (rel_xmin, rel_ymin),
-                rel_xmax - rel_xmin,
-                rel_ymax - rel_ymin,
-                fill=False,
-                color=c,
-                linewidth=2,
-            )
-        )
+        rects.append((rel_xmin, rel_ymin, rel_xmax, rel_ymax, _rgba(c), 2))
         text = f"{label}: {cell.confidence_score:0.2f}"
-        ax.text(
-            rel_xmin,
-            rel_ymin,
-            text,
-            fontsize=12,
-            bbox=dict(facecolor="yellow", alpha=0.5),
+        labels.append(
+            (rel_xmin, rel_ymin, text, _rgba([0, 0, 0]), _rgba([1, 1, 0], 0.5), "lb")
         )
-    plt.axis("off")
-    plt.title("Table Structure Result (Cropped)")
-    if save_path:
-        plt.savefig(save_path, bbox_inches="tight")
-        plt.close()
-    else:
-        plt.show()
+
+    _save_annotated_image(
+        cropped,
+        rects,
+        labels,
+        "Table Structure Result (Cropped)",
+        save_path,
+        font_scale=1 / 60,
+    )
 
 
 def visualize_cell_grid(
@@ -148,69 +196,50 @@ def visualize_cell_grid(
         visualization_save_dir,
         f"cellgrid_page{page_image.page_number}_table{page_image.page_number}.png",
     )
-    
+
     if not table_grid or not table_grid.cells:
         print("No cells detected in grid, skipping visualization.")
         return
 
-    COLORS = [
-        [0.000, 0.447, 0.741],  # Blue
-        [0.850, 0.325, 0.098],  # Red
-        [0.929, 0.694, 0.125],  # Yellow
-        [0.494, 0.184, 0.556],  # Purple
-        [0.466, 0.674, 0.188],  # Green
-        [0.301, 0.745, 0.933],  # Cyan
-        [0.635, 0.078, 0.184],  # Dark Red
-        [0.300, 0.300, 0.300],  # Gray
-        [0.800, 0.500, 0.300],  # Orange
-    ]
-
     # Crop the table image
     cropped = page_image.image_data[
         table_grid.table_box.y_min : table_grid.table_box.y_max,
         table_grid.table_box.x_min : table_grid.table_box.x_max,
     ]
-    plt.figure(figsize=(12, 8))
-    plt.imshow(cropped)
-    ax = plt.gca()
 
     print(f"Table grid: {table_grid.n_rows} rows × {table_grid.n_cols} columns")
 
+    # Colors depend on the column only; convert them once, along with the
+    # fixed label colors and the crop offset
+    column_colors = [
+        _rgba(GRID_COLORS[c % len(GRID_COLORS)], 0.7)
+        for c in range(table_grid.n_cols)
+    ]
+    white, black = _rgba([1, 1, 1]), _rgba([0, 0, 0])
+    text_background = _rgba([1, 1, 1], 0.7)
+    x_offset, y_offset = table_grid.table_box.x_min, table_grid.table_box.y_min
+
+    rects, labels, text_labels = [], [], []
     for cell in table_grid.cells:
         r, c = cell.row, cell.col
         box = cell.box
-        color_idx = c % len(COLORS)
-        cell_color = COLORS[color_idx]
+        cell_color = (
+            column_colors[c]
+            if c < len(column_colors)
+            else _rgba(GRID_COLORS[c % len(GRID_COLORS)], 0.7)
+        )
 
         # Draw cell box relative to crop
-        rel_xmin = box.x_min - table_grid.table_box.x_min
-        rel_ymin = box.y_min - table_grid.table_box.y_min
-        rel_xmax = box.x_max - table_grid.table_box.x_min
-        rel_ymax = box.y_max - table_grid.table_box.y_min
-
-        rect = plt.Rectangle(
-            (rel_xmin, rel_ymin),
-            rel_xmax - rel_xmin,
-            rel_ymax - rel_ymin,
-            fill=False,
-            color=cell_color,
-            linewidth=2,
-            alpha=0.7,
-        )
-        ax.add_patch(rect)
+        rel_xmin = box.x_min - x_offset
+        rel_ymin = box.y_min - y_offset
+        rel_xmax = box.x_max - x_offset
+        rel_ymax = box.y_max - y_offset
+
+        rects.append((rel_xmin, rel_ymin, rel_xmax, rel_ymax, cell_color, 2))
 
         cell_label = f"r{r},c{c}"
-        label_x = rel_xmin + 5
-        label_y = rel_ymin + 15
-
-        ax.text(
-            label_x,
-            label_y,
-            cell_label,
-            fontsize=12,
-            color="white",
-            bbox=dict(facecolor=cell_color, alpha=0.7, pad=0.2),
-            zorder=10,
+        labels.append(
+            (rel_xmin + 5, rel_ymin + 5, cell_label, white, cell_color, "lt")
         )
 
         if show_text and cell.text:
@@ -219,26 +248,16 @@ def visualize_cell_grid(
                 text = text[:17] + "..."
             center_x = rel_xmin + (rel_xmax - rel_xmin) / 2
             center_y = rel_ymin + (rel_ymax - rel_ymin) / 2
-            ax.text(
-                center_x,
-                center_y,
-                text,
-                fontsize=12,
-                ha="center",
-                va="center",
-                bbox=dict(facecolor="white", alpha=0.7, pad=0.3),
-                wrap=True,
-                zorder=5,
+            text_labels.append(
+                (center_x, center_y, text, black, text_background, "mm")
             )
 
-    plt.title(
-        f"Table Cell Grid: {table_grid.n_rows} rows × {table_grid.n_cols} columns (Cropped)"
+    # Cell labels are drawn over the cell texts, as before
+    _save_annotated_image(
+        cropped,
+        rects,
+        text_labels + labels,
+        f"Table Cell Grid: {table_grid.n_rows} rows × {table_grid.n_cols} columns (Cropped)",
+        save_path,
+        font_scale=1 / 60,
     )
-    plt.axis("off")
-
-    if save_path:
-        plt.savefig(save_path, bbox_inches="tight")
-        plt.close()
-    else:
-        plt.tight_layout()
-        plt.show()
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+from transformers import DetrFeatureExtractor
+
+from pdf2table.frameworks.image_preprocessing import TensorImagePreprocessor
+
+
+class TestTensorImagePreprocessor(unittest.TestCase):
+    """Test suite for TensorImagePreprocessor."""
+
+    def setUp(self):
+        self.feature_extractor = DetrFeatureExtractor()
+        rng = np.random.default_rng(0)
+        page = rng.integers(0, 256, (300, 500, 3), dtype=np.uint8)
+        # Strided crops, like the table slices the recognizer receives
+        self.images = [page[10:250, 20:420], page[50:200, 100:300]]
+
+    def _assert_matches_feature_extractor(self, preprocessor, atol):
+        expected = self.feature_extractor(self.images, return_tensors="pt")
+        result = preprocessor(self.images)
+
+        assert result["pixel_values"].shape == expected["pixel_values"].shape
+        assert (result["pixel_mask"] == expected["pixel_mask"]).all()
+        max_diff = (result["pixel_values"] - expected["pixel_values"]).abs().max()
+        assert max_diff <= atol, max_diff
+
+    def test_matches_feature_extractor(self):
+        """Test that the uint8 resize used on CPU matches the feature extractor."""
+        preprocessor = TensorImagePreprocessor(self.feature_extractor, device="cpu")
+
+        assert preprocessor._resize_uint8
+        # One uint8 level after normalization is ~0.0175
+        self._assert_matches_feature_extractor(preprocessor, atol=0.02)
+
+    def test_float_resize_path_matches_feature_extractor(self):
+        """Test the float resize taken on non-CPU devices, forced on CPU."""
+        preprocessor = TensorImagePreprocessor(self.feature_extractor, device="cpu")
+        preprocessor._resize_uint8 = False
+
+        self._assert_matches_feature_extractor(preprocessor, atol=0.02)
+
+    def test_resizes_in_float_off_cpu(self):
+        """Test that non-CPU devices do not take the uint8 resize."""
+        preprocessor = TensorImagePreprocessor(self.feature_extractor, device="meta")
+
+        assert not preprocessor._resize_uint8
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+import torch
+from transformers import (
+    TrOCRConfig, ViTConfig, VisionEncoderDecoderConfig, VisionEncoderDecoderModel
+)
+
+from pdf2table.frameworks.ocr_service import TrOCRService
+
+
+PAD, EOS = 1, 2
+
+
+def _tiny_trocr(seed: int) -> VisionEncoderDecoderModel:
+    """A small random TrOCR, built from its config without any download."""
+    torch.manual_seed(seed)
+    encoder = ViTConfig(
+        image_size=32, patch_size=8, hidden_size=32, num_hidden_layers=1,
+        num_attention_heads=2, intermediate_size=64
+    )
+    decoder = TrOCRConfig(
+        vocab_size=30, d_model=32, decoder_layers=1, decoder_attention_heads=2,
+        decoder_ffn_dim=64, pad_token_id=PAD, bos_token_id=0, eos_token_id=EOS,
+        decoder_start_token_id=EOS
+    )
+    config = VisionEncoderDecoderConfig.from_encoder_decoder_configs(encoder, decoder)
+    config.decoder_start_token_id = EOS
+    config.pad_token_id = PAD
+    config.eos_token_id = EOS
+    model = VisionEncoderDecoderModel(config=config)
+    model.generation_config.decoder_start_token_id = EOS
+    model.generation_config.pad_token_id = PAD
+    model.generation_config.eos_token_id = EOS
+    # Large decoder weights, with EOS favoured, make rows stop at varied steps
+    with torch.no_grad():
+        for param in model.decoder.parameters():
+            param.normal_(0, 0.5)
+        model.decoder.output_projection.weight[EOS] *= 2
+    return model.eval()
+
+
+class TestGreedyDecode(unittest.TestCase):
+    """Test suite for TrOCRService._greedy_decode."""
+
+    max_length = 20
+
+    def _service(self, model: VisionEncoderDecoderModel) -> TrOCRService:
+        # Skip __init__, which loads a pretrained processor and model
+        service = TrOCRService.__new__(TrOCRService)
+        service.model = model
+        service.max_length = self.max_length
+        return service
+
+    def test_matches_generate(self):
+        """Test token-for-token equality with greedy model.generate."""
+        for seed in (0, 1):
+            service = self._service(_tiny_trocr(seed))
+            pixel_values = torch.randn(8, 3, 32, 32)
+            with torch.inference_mode():
+                expected = service.model.generate(
+                    pixel_values, num_beams=1, do_sample=False,
+                    max_length=self.max_length
+                )
+                result = service._greedy_decode(pixel_values)
+
+            # Some rows stop early and others run to max_length, so finished
+            # rows are dropped from the decoder batch mid-way
+            stopped = (expected[:, 1:] == EOS).any(dim=1)
+            assert stopped.any() and not stopped.all(), expected
+
+            assert result.shape == expected.shape, (result.shape, expected.shape)
+            assert torch.equal(result, expected), (result, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
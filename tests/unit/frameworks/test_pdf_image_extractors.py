@@ -0,0 +1,78 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+
+from pdf2table.frameworks.pdf_image_extractor import PyMuPDFImageExtractor
+
+
+def _write_pdf(path: str, page_boxes: bytes = b""):
+    """Write a one-page A4 PDF whose MediaBox is only set on the page tree."""
+    content = b"BT /F1 24 Tf 72 700 Td (Progress report) Tj ET"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 /MediaBox [0 0 595 842] >>",
+        b"<< /Type /Page /Parent 2 0 R " + page_boxes
+        + b"/Contents 4 0 R /Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        data += b"%010d 00000 n \n" % offset
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref
+    )
+    with open(path, "wb") as f:
+        f.write(bytes(data))
+
+
+@unittest.skipUnless(
+    importlib.util.find_spec("pypdfium2"), "pypdfium2 is not installed"
+)
+class TestPdfiumImageExtractor(unittest.TestCase):
+    """Test suite comparing the PDFium backend with PyMuPDF."""
+
+    def _assert_words_match_pymupdf(self, page_boxes: bytes = b""):
+        from pdf2table.frameworks.pdfium_image_extractor import PdfiumImageExtractor
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pdf_path = os.path.join(tmp_dir, "test.pdf")
+            _write_pdf(pdf_path, page_boxes)
+            pdfium = PdfiumImageExtractor(dpi=150)
+            pymupdf = PyMuPDFImageExtractor(dpi=150)
+            try:
+                pdfium_page = pdfium.extract_page_image(pdf_path, 0)
+                pymupdf_page = pymupdf.extract_page_image(pdf_path, 0)
+            finally:
+                pdfium.close()
+                pymupdf.close()
+
+        assert pdfium_page.image_data.shape == pymupdf_page.image_data.shape
+        assert [w[4] for w in pdfium_page.words] == ["Progress", "report"]
+        assert [w[4] for w in pymupdf_page.words] == ["Progress", "report"]
+        # The backends bound glyphs slightly differently, but every word
+        # must land at the same place in the image
+        for (x0, y0, x1, y1, _), (u0, v0, u1, v1, _) in zip(
+            pdfium_page.words, pymupdf_page.words
+        ):
+            assert abs((x0 + x1) - (u0 + u1)) / 2 <= 6
+            assert abs((y0 + y1) - (v0 + v1)) / 2 <= 6
+
+    def test_word_boxes_match_pymupdf_with_inherited_media_box(self):
+        """Test word boxes on a page without boxes of its own."""
+        self._assert_words_match_pymupdf()
+
+    def test_word_boxes_match_pymupdf_with_crop_box(self):
+        """Test word boxes on a page cropped inside the inherited media box."""
+        self._assert_words_match_pymupdf(b"/CropBox [40 60 500 800] ")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,8 +3,10 @@
 Simplified working unit tests for the Clean Architecture table extraction system.
 These tests focus on the most important functionality and avoid complex integration scenarios.
 """
+import copy
+import pickle
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import numpy as np
 
 # Test imports
@@ -48,6 +50,21 @@ class TestCleanArchitectureCore(unittest.TestCase):
         clusters = CoordinateClusteringService.cluster_coordinates(coords, threshold=5.0)
         self.assertEqual(len(clusters), 2)
     
+    def test_coordinate_clustering(self):
+        """Test clustering merges nearby coordinates into their mean"""
+        self.assertEqual(CoordinateClusteringService.cluster_coordinates([]), [])
+
+        clusters = CoordinateClusteringService.cluster_coordinates(
+            [10.0, 12.0, 50.0, 52.0, 12.0], threshold=5.0
+        )
+        self.assertEqual(clusters, [11.0, 51.0])
+
+        # Mean gap of 55 raises the threshold to 38.5, merging 100 and 110
+        clusters = CoordinateClusteringService.cluster_coordinates(
+            [0.0, 100.0, 110.0], threshold=5.0
+        )
+        self.assertEqual(clusters, [0.0, 105.0])
+    
     def test_use_case_layer_with_simple_mocks(self):
         """Test use case layer with simplified mocking"""
         # Create simple mocks
@@ -132,6 +149,37 @@ class TestCleanArchitectureCore(unittest.TestCase):
         self.assertEqual(metadata["source_file"], "test.pdf")
 
 
+class TestTrustedBoundingBox(unittest.TestCase):
+    """BoundingBox._trusted must build the same object as validation does."""
+
+    def setUp(self):
+        self.validated = BoundingBox(x_min=10, y_min=20, x_max=110, y_max=220)
+
+    def _check_equivalent(self, box):
+        self.assertEqual(box, self.validated)
+        self.assertEqual(box.model_fields_set, self.validated.model_fields_set)
+        self.assertEqual(box.model_dump(), self.validated.model_dump())
+        self.assertEqual(box.model_dump_json(), self.validated.model_dump_json())
+        self.assertEqual(pickle.loads(pickle.dumps(box)), self.validated)
+        self.assertEqual(copy.deepcopy(box), self.validated)
+        self.assertEqual(copy.copy(box), self.validated)
+        self.assertEqual(box.model_copy(), self.validated)
+        self.assertEqual(
+            box.model_copy(update={"x_max": 120}).x_max, 120
+        )
+        self.assertEqual(box.width, 100)
+        self.assertEqual(box.height, 200)
+
+    def test_trusted_box_matches_validated_box(self):
+        self._check_equivalent(BoundingBox._trusted(10, 20, 110, 220))
+
+    def test_trusted_box_falls_back_to_model_construct(self):
+        with patch(
+            "pdf2table.entities.table_entities._HAS_V2_SLOTS", False
+        ):
+            box = BoundingBox._trusted(10, 20, 110, 220)
+        self._check_equivalent(box)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
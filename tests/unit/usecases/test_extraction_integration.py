@@ -33,6 +33,7 @@ class TestTableExtractionIntegration(unittest.TestCase):
             page_number=0,
             image_data=np.random.randint(0, 255, (300, 400, 3), dtype=np.uint8),
             source_file="sample.pdf",
+            words=[]
         )
         mock_pdf_extractor.extract_page_image.return_value = page_image
 
@@ -71,9 +72,12 @@ class TestTableExtractionIntegration(unittest.TestCase):
         ]
         mock_structure_recognizer.recognize_structure.return_value = detected_cells
 
-        # Mock OCR to return different text for different cells
+        # Mock OCR to return different text for different cells (one batch
+        # call per table)
         ocr_responses = ["Header 1", "Header 2", "Data 1", "Data 2"]
-        mock_ocr_service.extract_text.side_effect = ocr_responses
+        mock_ocr_service.extract_text_batch.side_effect = lambda crops: (
+            ocr_responses + [""] * len(crops)
+        )[: len(crops)]
 
         # Create use case and run extraction
         use_case = TableExtractionUseCase(
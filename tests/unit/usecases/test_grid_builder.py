@@ -22,25 +22,27 @@ class TestTableGridBuilder(unittest.TestCase):
 
     def test_build_grid_with_valid_cells(self):
         """Test building a grid from valid detected cells."""
-        # Arrange: at least 2 rows and 2 columns for a valid grid
+        # Arrange: at least 2 rows and 2 columns for a valid grid. Rows and
+        # columns span the table, as the structure model detects them; thin
+        # bands at the edges would be merged by the edge clustering
         detected_cells = [
             DetectedCell(
-                box=BoundingBox(x_min=0, y_min=0, x_max=50, y_max=10),  # row 1
+                box=BoundingBox(x_min=0, y_min=0, x_max=110, y_max=55),  # row 1
                 cell_type="table row",
                 confidence_score=0.8,
             ),
             DetectedCell(
-                box=BoundingBox(x_min=0, y_min=100, x_max=50, y_max=110),  # row 2 (y_min=100, y_max=110)
+                box=BoundingBox(x_min=0, y_min=55, x_max=110, y_max=110),  # row 2
                 cell_type="table row",
                 confidence_score=0.7,
             ),
             DetectedCell(
-                box=BoundingBox(x_min=0, y_min=0, x_max=10, y_max=110),  # col 1
+                box=BoundingBox(x_min=0, y_min=0, x_max=55, y_max=110),  # col 1
                 cell_type="table column",
                 confidence_score=0.9,
             ),
             DetectedCell(
-                box=BoundingBox(x_min=100, y_min=0, x_max=110, y_max=110),  # col 2 (x_min=100, x_max=110)
+                box=BoundingBox(x_min=55, y_min=0, x_max=110, y_max=110),  # col 2
                 cell_type="table column",
                 confidence_score=0.8,
             ),
@@ -50,11 +52,12 @@ class TestTableGridBuilder(unittest.TestCase):
             page_number=0,
             image_data=np.zeros((200, 200, 3), dtype=np.uint8),
             source_file="test.pdf",
+            words=[]
         )
 
         table_box = BoundingBox(x_min=0, y_min=0, x_max=120, y_max=120)
 
-        self.mock_ocr_service.extract_text.return_value = "cell text"
+        self.mock_ocr_service.extract_text_batch.side_effect = lambda crops: ["cell text"] * len(crops)
 
         # Act
         result = self.builder.build_grid(detected_cells, page_image, table_box)
@@ -65,6 +68,9 @@ class TestTableGridBuilder(unittest.TestCase):
         assert result.n_rows >= 2
         assert result.n_cols >= 2
         assert len(result.cells) == result.n_rows * result.n_cols
+        # Without embedded text, every cell is OCRed in one batch
+        self.mock_ocr_service.extract_text_batch.assert_called_once()
+        assert all(cell.text == "cell text" for cell in result.cells)
 
     def test_build_grid_with_empty_cells(self):
         """Test handling of empty cell list."""
@@ -74,6 +80,7 @@ class TestTableGridBuilder(unittest.TestCase):
             page_number=0,
             image_data=np.zeros((200, 200, 3), dtype=np.uint8),
             source_file="test.pdf",
+            words=[]
         )
         table_box = BoundingBox(x_min=0, y_min=0, x_max=120, y_max=120)
 
@@ -83,6 +90,96 @@ class TestTableGridBuilder(unittest.TestCase):
         # Assert
         assert result is None
 
+    def test_build_grid_ocrs_cells_in_one_batch(self):
+        """Test that cells without PDF text are OCRed with a single batch call."""
+        # Arrange: a 2x2 grid from two row and two column detections
+        detected_cells = [
+            DetectedCell(
+                box=BoundingBox(x_min=0, y_min=0, x_max=120, y_max=50),
+                cell_type="table row",
+                confidence_score=0.9,
+            ),
+            DetectedCell(
+                box=BoundingBox(x_min=0, y_min=50, x_max=120, y_max=100),
+                cell_type="table row",
+                confidence_score=0.9,
+            ),
+            DetectedCell(
+                box=BoundingBox(x_min=0, y_min=0, x_max=60, y_max=100),
+                cell_type="table column",
+                confidence_score=0.8,
+            ),
+            DetectedCell(
+                box=BoundingBox(x_min=60, y_min=0, x_max=120, y_max=100),
+                cell_type="table column",
+                confidence_score=0.8,
+            ),
+        ]
+        page_image = PageImage(
+            page_number=0,
+            image_data=np.zeros((200, 200, 3), dtype=np.uint8),
+            source_file="test.pdf",
+            words=[(5, 5, 30, 20, "Name")],
+        )
+        table_box = BoundingBox(x_min=0, y_min=0, x_max=120, y_max=100)
+        self.mock_ocr_service.extract_text_batch.side_effect = lambda crops: [
+            f"ocr {i}" for i in range(len(crops))
+        ]
+
+        # Act
+        result = self.builder.build_grid(detected_cells, page_image, table_box)
+
+        # Assert: the cell with an embedded word skips OCR
+        self.mock_ocr_service.extract_text_batch.assert_called_once()
+        assert len(self.mock_ocr_service.extract_text_batch.call_args.args[0]) == 3
+        self.mock_ocr_service.extract_text.assert_not_called()
+        texts = [[result.get_cell(r, c).text for c in range(2)] for r in range(2)]
+        assert texts == [["Name", "ocr 0"], ["ocr 1", "ocr 2"]]
+
+    def test_extract_pdf_texts_matches_strict_overlap(self):
+        """Test that words join every cell they overlap, but not cells they only touch."""
+        # Arrange
+        page_image = PageImage(
+            page_number=0,
+            image_data=np.zeros((200, 200, 3), dtype=np.uint8),
+            source_file="test.pdf",
+            words=[
+                (10, 10, 40, 20, "left"),
+                (50, 10, 70, 20, "both"),
+                (100, 10, 110, 20, "edge"),
+                (20, 30, 20, 40, "empty"),
+            ],
+        )
+        cell_boxes = [
+            BoundingBox(x_min=0, y_min=0, x_max=60, y_max=50),
+            BoundingBox(x_min=60, y_min=0, x_max=100, y_max=50),
+        ]
+
+        # Act
+        texts = self.builder._extract_pdf_texts(cell_boxes, page_image)
+
+        # Assert
+        assert texts == ["left both", "both"]
+
+    def test_ocr_cache_reuses_results_for_identical_crops(self):
+        """Test that identical crops are OCRed once, within and across batches."""
+        # Arrange
+        builder = TableGridBuilder(self.mock_ocr_service, ocr_cache_size=8)
+        self.mock_ocr_service.extract_text_batch.side_effect = lambda crops: [
+            f"ocr {crop[0, 0, 0]}" for crop in crops
+        ]
+        blank = np.zeros((10, 20, 3), dtype=np.uint8)
+        marked = np.full((10, 20, 3), 7, dtype=np.uint8)
+
+        # Act
+        first = builder._ocr_crops([blank, marked, blank.copy()])
+        second = builder._ocr_crops([marked, blank])
+
+        # Assert
+        assert first == ["ocr 0", "ocr 7", "ocr 0"]
+        assert second == ["ocr 7", "ocr 0"]
+        self.mock_ocr_service.extract_text_batch.assert_called_once()
+        assert len(self.mock_ocr_service.extract_text_batch.call_args.args[0]) == 2
 
 
 if __name__ == "__main__":
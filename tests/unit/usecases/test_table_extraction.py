@@ -1,3 +1,6 @@
+import os
+import tempfile
+import threading
 import unittest
 from unittest.mock import Mock
 import numpy as np
@@ -36,7 +39,8 @@ class TestTableExtractionUseCase(unittest.TestCase):
         page_image = PageImage(
             page_number=page_number,
             image_data=mock_image_data,
-            source_file=pdf_path
+            source_file=pdf_path,
+            words=[]
         )
         self.mock_pdf_extractor.extract_page_image.return_value = page_image
         
@@ -76,7 +80,7 @@ class TestTableExtractionUseCase(unittest.TestCase):
         self.mock_structure_recognizer.recognize_structure.return_value = detected_cells
         
         # Mock OCR
-        self.mock_ocr_service.extract_text.return_value = "test text"
+        self.mock_ocr_service.extract_text_batch.side_effect = lambda crops: ["test text"] * len(crops)
         
         # Act
         result = self.use_case._extract_tables_from_page(pdf_path, page_number)
@@ -101,7 +105,8 @@ class TestTableExtractionUseCase(unittest.TestCase):
         page_image = PageImage(
             page_number=page_number,
             image_data=mock_image_data,
-            source_file=pdf_path
+            source_file=pdf_path,
+            words=[]
         )
         self.mock_pdf_extractor.extract_page_image.return_value = page_image
         
@@ -138,7 +143,8 @@ class TestTableExtractionUseCase(unittest.TestCase):
         page_image = PageImage(
             page_number=page_number,
             image_data=mock_image_data,
-            source_file=pdf_path
+            source_file=pdf_path,
+            words=[]
         )
         self.mock_pdf_extractor.extract_page_image.return_value = page_image
         
@@ -186,8 +192,11 @@ class TestTableExtractionUseCase(unittest.TestCase):
                     ),
                 ]
         
+        self.mock_structure_recognizer.recognize_structures_batch.side_effect = Exception(
+            "Batch failed"
+        )
         self.mock_structure_recognizer.recognize_structure.side_effect = mock_recognize_structure
-        self.mock_ocr_service.extract_text.return_value = "test"
+        self.mock_ocr_service.extract_text_batch.side_effect = lambda crops: ["test"] * len(crops)
         
         # Act
         result = self.use_case._extract_tables_from_page(pdf_path, page_number)
@@ -197,6 +206,373 @@ class TestTableExtractionUseCase(unittest.TestCase):
         # The x_min may not be exactly 60 due to test data, so just check grid exists
         assert result[0].grid is not None
 
+    def test_extract_tables_from_page_batches_structure_recognition(self):
+        """Test that all tables on a page go through one batched structure call."""
+        # Arrange
+        pdf_path = "test.pdf"
+        page_number = 0
+
+        page_image = PageImage(
+            page_number=page_number,
+            image_data=np.zeros((200, 200, 3), dtype=np.uint8),
+            source_file=pdf_path,
+            words=[]
+        )
+        self.mock_pdf_extractor.extract_page_image.return_value = page_image
+
+        tables = [
+            DetectedTable(
+                detection_box=BoundingBox(x_min=0, y_min=0, x_max=100, y_max=100),
+                confidence_score=0.95,
+                page_number=page_number,
+                source_file=pdf_path
+            ),
+            DetectedTable(
+                detection_box=BoundingBox(x_min=100, y_min=100, x_max=200, y_max=200),
+                confidence_score=0.90,
+                page_number=page_number,
+                source_file=pdf_path
+            ),
+        ]
+        self.mock_table_detector.detect_tables.return_value = tables
+        self.mock_structure_recognizer.recognize_structures_batch.return_value = [[], []]
+
+        # Act
+        result = self.use_case._extract_tables_from_page(pdf_path, page_number)
+
+        # Assert
+        assert result == []
+        _, table_boxes = self.mock_structure_recognizer.recognize_structures_batch.call_args.args
+        assert table_boxes == [table.detection_box for table in tables]
+        self.mock_structure_recognizer.recognize_structure.assert_not_called()
+
+    def test_extract_tables_all_pages_with_prefetch(self):
+        """Test that prefetched pages are processed in order and page failures are skipped."""
+        # Arrange
+        pdf_path = "test.pdf"
+        self.mock_pdf_extractor.get_page_count.return_value = 3
+
+        def mock_extract_page_image(path, page_number):
+            if page_number == 1:
+                raise RuntimeError("Rendering failed")
+            return PageImage(
+                page_number=page_number,
+                image_data=np.zeros((100, 100, 3), dtype=np.uint8),
+                source_file=path,
+                words=[]
+            )
+
+        self.mock_pdf_extractor.extract_page_image.side_effect = mock_extract_page_image
+        self.mock_table_detector.detect_tables.return_value = []
+        
+        use_case = TableExtractionUseCase(
+            pdf_extractor=self.mock_pdf_extractor,
+            table_detector=self.mock_table_detector,
+            structure_recognizer=self.mock_structure_recognizer,
+            ocr_service=self.mock_ocr_service,
+            prefetch_pages=True
+        )
+        
+        # Act
+        response = use_case.extract_tables(pdf_path)
+        
+        # Assert
+        assert response.success
+        assert self.mock_pdf_extractor.extract_page_image.call_count == 3
+        detected_pages = [
+            call.args[0].page_number
+            for call in self.mock_table_detector.detect_tables.call_args_list
+        ]
+        assert detected_pages == [0, 2]
+
+    def test_extract_tables_all_pages_with_prefetched_detection(self):
+        """Test that detection runs once per page in the prefetch thread."""
+        # Arrange
+        pdf_path = "test.pdf"
+        self.mock_pdf_extractor.get_page_count.return_value = 3
+        self.mock_pdf_extractor.extract_page_image.side_effect = (
+            lambda path, page_number: PageImage(
+                page_number=page_number,
+                image_data=np.zeros((100, 100, 3), dtype=np.uint8),
+                source_file=path,
+                words=[]
+            )
+        )
+        detection_threads = []
+
+        def mock_detect_tables(page_image):
+            detection_threads.append(threading.current_thread())
+            return []
+
+        self.mock_table_detector.detect_tables.side_effect = mock_detect_tables
+
+        use_case = TableExtractionUseCase(
+            pdf_extractor=self.mock_pdf_extractor,
+            table_detector=self.mock_table_detector,
+            structure_recognizer=self.mock_structure_recognizer,
+            ocr_service=self.mock_ocr_service,
+            prefetch_detection=True
+        )
+
+        # Act
+        response = use_case.extract_tables(pdf_path)
+
+        # Assert
+        assert response.success
+        detected_pages = [
+            call.args[0].page_number
+            for call in self.mock_table_detector.detect_tables.call_args_list
+        ]
+        assert detected_pages == [0, 1, 2]
+        assert threading.main_thread() not in detection_threads
+
+    def test_extract_tables_all_pages_with_batched_detection(self):
+        """Test that pages are detected in batches of detection_batch_size."""
+        # Arrange
+        pdf_path = "test.pdf"
+        self.mock_pdf_extractor.get_page_count.return_value = 5
+        self.mock_pdf_extractor.extract_page_image.side_effect = (
+            lambda path, page_number: PageImage(
+                page_number=page_number,
+                image_data=np.zeros((100, 100, 3), dtype=np.uint8),
+                source_file=path,
+                words=[]
+            )
+        )
+        self.mock_table_detector.detect_tables_batch.side_effect = (
+            lambda page_images: [[] for _ in page_images]
+        )
+        self.mock_table_detector.detect_tables.return_value = []
+
+        use_case = TableExtractionUseCase(
+            pdf_extractor=self.mock_pdf_extractor,
+            table_detector=self.mock_table_detector,
+            structure_recognizer=self.mock_structure_recognizer,
+            ocr_service=self.mock_ocr_service,
+            detection_batch_size=2
+        )
+
+        # Act
+        response = use_case.extract_tables(pdf_path)
+
+        # Assert: a trailing single page goes through detect_tables
+        assert response.success
+        batches = [
+            [page_image.page_number for page_image in call.args[0]]
+            for call in self.mock_table_detector.detect_tables_batch.call_args_list
+        ]
+        assert batches == [[0, 1], [2, 3]]
+        assert self.mock_table_detector.detect_tables.call_args.args[0].page_number == 4
+        assert self.mock_table_detector.detect_tables.call_count == 1
+
+    def test_extract_tables_from_pages_batches_selected_pages(self):
+        """Test that selected pages are detected together and returned in page order."""
+        # Arrange
+        pdf_path = "test.pdf"
+        self.mock_pdf_extractor.extract_page_image.side_effect = (
+            lambda path, page_number: PageImage(
+                page_number=page_number,
+                image_data=np.zeros((100, 100, 3), dtype=np.uint8),
+                source_file=path,
+                words=[]
+            )
+        )
+        self.mock_table_detector.detect_tables_batch.side_effect = (
+            lambda page_images: [[] for _ in page_images]
+        )
+
+        use_case = TableExtractionUseCase(
+            pdf_extractor=self.mock_pdf_extractor,
+            table_detector=self.mock_table_detector,
+            structure_recognizer=self.mock_structure_recognizer,
+            ocr_service=self.mock_ocr_service,
+            detection_batch_size=4
+        )
+
+        # Act
+        response = use_case.extract_tables_from_pages(pdf_path, [4, 0, 4])
+
+        # Assert: one batch over the distinct pages, in page order
+        assert response.success
+        batches = [
+            [page_image.page_number for page_image in call.args[0]]
+            for call in self.mock_table_detector.detect_tables_batch.call_args_list
+        ]
+        assert batches == [[0, 4]]
+        self.mock_pdf_extractor.get_page_count.assert_not_called()
+        self.mock_pdf_extractor.close.assert_called_once()
+
+    def test_extract_pipeline_yields_pages_in_order(self):
+        """Test that the staged pipeline yields every page once, in order."""
+        # Arrange
+        pdf_path = "test.pdf"
+        self.mock_pdf_extractor.get_page_count.return_value = 5
+
+        def mock_extract_page_image(path, page_number):
+            if page_number == 2:
+                raise RuntimeError("render failed")
+            return PageImage(
+                page_number=page_number,
+                image_data=np.zeros((100, 100, 3), dtype=np.uint8),
+                source_file=path,
+                words=[]
+            )
+
+        self.mock_pdf_extractor.extract_page_image.side_effect = mock_extract_page_image
+        detection_threads = []
+
+        def mock_detect(page_images):
+            detection_threads.append(threading.current_thread())
+            return [[] for _ in page_images]
+
+        self.mock_table_detector.detect_tables_batch.side_effect = mock_detect
+        self.mock_table_detector.detect_tables.side_effect = (
+            lambda page_image: mock_detect([page_image])[0]
+        )
+
+        use_case = TableExtractionUseCase(
+            pdf_extractor=self.mock_pdf_extractor,
+            table_detector=self.mock_table_detector,
+            structure_recognizer=self.mock_structure_recognizer,
+            ocr_service=self.mock_ocr_service,
+            detection_batch_size=2
+        )
+
+        # Act
+        results = list(use_case.extract_pipeline(pdf_path))
+
+        # Assert: the page that failed to render is skipped
+        assert results == [(0, []), (1, []), (3, []), (4, [])]
+        assert threading.main_thread() not in detection_threads
+        self.mock_pdf_extractor.close.assert_called_once()
+
+    def test_extract_tables_reuses_cached_page_results(self):
+        """Test that cached pages are not re-extracted until the PDF changes."""
+        # Arrange
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pdf_path = os.path.join(tmp_dir, "test.pdf")
+            open(pdf_path, "wb").close()
+            self.mock_pdf_extractor.get_page_count.return_value = 2
+            self.mock_pdf_extractor.extract_page_image.side_effect = (
+                lambda path, page_number: PageImage(
+                    page_number=page_number,
+                    image_data=np.zeros((100, 100, 3), dtype=np.uint8),
+                    source_file=path,
+                    words=[]
+                )
+            )
+            self.mock_table_detector.detect_tables.return_value = []
+
+            use_case = TableExtractionUseCase(
+                pdf_extractor=self.mock_pdf_extractor,
+                table_detector=self.mock_table_detector,
+                structure_recognizer=self.mock_structure_recognizer,
+                ocr_service=self.mock_ocr_service,
+                page_cache_size=8
+            )
+
+            # Act
+            use_case.extract_tables(pdf_path, page_number=0)
+            use_case.extract_tables(pdf_path)
+            use_case.extract_tables(pdf_path)
+            os.utime(pdf_path, (0, 0))
+            use_case.extract_tables(pdf_path, page_number=1)
+
+            # Assert
+            rendered_pages = [
+                call.args[1]
+                for call in self.mock_pdf_extractor.extract_page_image.call_args_list
+            ]
+            assert rendered_pages == [0, 1, 1]
+
+    def test_extract_tables_reuses_disk_cached_pages_across_instances(self):
+        """Test that page results stored on disk are reused by a new use case with the same settings."""
+        # Arrange
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pdf_path = os.path.join(tmp_dir, "test.pdf")
+            with open(pdf_path, "wb") as f:
+                f.write(b"%PDF-1.4 test")
+            cache_dir = os.path.join(tmp_dir, "cache")
+            self.mock_pdf_extractor.extract_page_image.side_effect = (
+                lambda path, page_number: PageImage(
+                    page_number=page_number,
+                    image_data=np.zeros((100, 100, 3), dtype=np.uint8),
+                    source_file=path,
+                    words=[]
+                )
+            )
+            self.mock_table_detector.detect_tables.return_value = []
+
+            def make_use_case(tag):
+                return TableExtractionUseCase(
+                    pdf_extractor=self.mock_pdf_extractor,
+                    table_detector=self.mock_table_detector,
+                    structure_recognizer=self.mock_structure_recognizer,
+                    ocr_service=self.mock_ocr_service,
+                    page_cache_dir=cache_dir,
+                    page_cache_tag=tag
+                )
+
+            # Act
+            make_use_case("a").extract_tables(pdf_path, page_number=0)
+            response = make_use_case("a").extract_tables(pdf_path, page_number=0)
+            make_use_case("b").extract_tables(pdf_path, page_number=0)
+
+            # Assert: only the run with different settings re-renders
+            assert response.success
+            assert self.mock_pdf_extractor.extract_page_image.call_count == 2
+
+    def test_extract_tables_from_page_with_detection_dpi(self):
+        """Test that detection runs on a low-DPI render and boxes are mapped to the full render."""
+        # Arrange
+        pdf_path = "test.pdf"
+        page_number = 0
+
+        def mock_extract_page_image(
+            path, page_num, dpi=None, include_words=True, clip=None
+        ):
+            size = 100 if dpi == 150 else 200
+            return PageImage(
+                page_number=page_num,
+                image_data=np.zeros((size, size, 3), dtype=np.uint8),
+                source_file=path,
+                words=[]
+            )
+
+        self.mock_pdf_extractor.extract_page_image.side_effect = mock_extract_page_image
+        self.mock_table_detector.detect_tables.return_value = [
+            DetectedTable(
+                detection_box=BoundingBox(x_min=10, y_min=20, x_max=60, y_max=99),
+                confidence_score=0.95,
+                page_number=page_number,
+                source_file=pdf_path
+            )
+        ]
+        self.mock_structure_recognizer.recognize_structure.return_value = []
+
+        use_case = TableExtractionUseCase(
+            pdf_extractor=self.mock_pdf_extractor,
+            table_detector=self.mock_table_detector,
+            structure_recognizer=self.mock_structure_recognizer,
+            ocr_service=self.mock_ocr_service,
+            detection_dpi=150
+        )
+
+        # Act
+        use_case._extract_tables_from_page(pdf_path, page_number)
+
+        # Assert
+        calls = self.mock_pdf_extractor.extract_page_image.call_args_list
+        assert calls[0].kwargs == {"dpi": 150, "include_words": False}
+        assert calls[1].args == (pdf_path, page_number)
+        # Only the table region (plus rounding slack) is rendered at full DPI
+        assert calls[1].kwargs == {"clip": (0.08, 0.18, 0.62, 1.0)}
+        detected_image = self.mock_table_detector.detect_tables.call_args.args[0]
+        assert detected_image.width == 100
+        structure_image, table_box = self.mock_structure_recognizer.recognize_structure.call_args.args
+        assert structure_image.width == 200
+        assert table_box.to_list() == [20, 40, 120, 198]
+
 
 if __name__ == "__main__":
     unittest.main()